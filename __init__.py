@@ -40,13 +40,39 @@ Dependencies:
 - Additional dependencies based on enabled tools
 """
 
-from .agents.bedrock_agent import BedrockAgent
+import importlib
 
 # Version of the framework
 __version__ = '0.1.0'
 
+# Lazily exported attributes by submodule
+_SUBMOD_ATTRS = {
+    'agents.bedrock_agent': ['BedrockAgent'],
+}
+_ATTR_TO_SUBMOD = {attr: mod for mod, attrs in _SUBMOD_ATTRS.items() for attr in attrs}
+
 # List of public components
-__all__ = ['BedrockAgent']
+__all__ = sorted(_ATTR_TO_SUBMOD)
+
+
+def __getattr__(name):
+    """
+    Resolve public components lazily (PEP 562).
+
+    BedrockAgent transitively imports langchain, boto3 and every tool, so it
+    is only imported on first attribute access rather than at package import.
+    The resolved value is stored in the module so later lookups are direct.
+    """
+    submod = _ATTR_TO_SUBMOD.get(name)
+    if submod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{submod}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(globals()) + __all__
 
 """
 Framework Extension Guide:
@@ -54,14 +80,16 @@ Framework Extension Guide:
 
 1. Adding a New Agent:
 ---------------------
-To add a new agent implementation:
-    from .agents.new_agent import NewAgent
-    __all__.append('NewAgent')
+To add a new agent implementation, register it in _SUBMOD_ATTRS;
+__all__ and lazy resolution follow automatically:
+    'agents.new_agent': ['NewAgent']
 
 Example:
     # Adding OpenAI agent
-    from .agents.openai_agent import OpenAIAgent
-    __all__ = ['BedrockAgent', 'OpenAIAgent']
+    _SUBMOD_ATTRS = {
+        'agents.bedrock_agent': ['BedrockAgent'],
+        'agents.openai_agent': ['OpenAIAgent'],
+    }
 
 2. Adding Utility Functions:
 --------------------------
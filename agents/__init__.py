@@ -34,7 +34,7 @@ Adding New Agents:
 ----------------
 1. Create new agent file (e.g., openai_agent.py)
 2. Implement agent class inheriting from BaseAgent
-3. Import and add to __all__
+3. Register it in _SUBMOD_ATTRS (this also adds it to __all__)
 
 Example adding new agent:
     # In openai_agent.py:
@@ -42,8 +42,11 @@ Example adding new agent:
         ...
 
     # In this file:
-    from .openai_agent import OpenAIAgent
-    __all__ = ['BaseAgent', 'BedrockAgent', 'OpenAIAgent']
+    _SUBMOD_ATTRS = {
+        'base_agent': ['BaseAgent'],
+        'bedrock_agent': ['BedrockAgent'],
+        'openai_agent': ['OpenAIAgent'],
+    }
 
 Note:
 ----
@@ -52,13 +55,36 @@ Note:
 - Ensure all agents implement BaseAgent interface
 """
 
-from .base_agent import BaseAgent
-from .bedrock_agent import BedrockAgent
+import importlib
+
+# Lazily exported attributes by submodule
+_SUBMOD_ATTRS = {
+    'base_agent': ['BaseAgent'],        # Base class for all agents
+    'bedrock_agent': ['BedrockAgent'],  # AWS Bedrock implementation
+}
+_ATTR_TO_SUBMOD = {attr: mod for mod, attrs in _SUBMOD_ATTRS.items() for attr in attrs}
+
+__all__ = [attr for attrs in _SUBMOD_ATTRS.values() for attr in attrs]
+
+
+def __getattr__(name):
+    """
+    Resolve agent classes lazily (PEP 562).
+
+    Agent modules are only imported on first access so that importing the
+    package does not pull in langchain and boto3 up front. The resolved
+    class is stored in the module so later lookups are direct.
+    """
+    submod = _ATTR_TO_SUBMOD.get(name)
+    if submod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{submod}', __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = [
-    'BaseAgent',    # Base class for all agents
-    'BedrockAgent'  # AWS Bedrock implementation
-]
+def __dir__():
+    return list(globals()) + __all__
 
 """
 Future Extensions:
@@ -72,13 +98,13 @@ To add a new agent implementation:
    ├── bedrock_agent.py
    └── new_agent.py
 
-2. Import Agent:
-   Add import statement:
-   from .new_agent import NewAgent
+2. Register Agent:
+   Add the module to _SUBMOD_ATTRS so it is imported lazily:
+   'new_agent': ['NewAgent']
 
-3. Add to Exports:
-   Add to __all__ list:
-   __all__ = ['BaseAgent', 'BedrockAgent', 'NewAgent']
+3. Exports:
+   __all__ is derived from _SUBMOD_ATTRS:
+   ['BaseAgent', 'BedrockAgent', 'NewAgent']
 
 4. Document Agent:
    Update this docstring with:
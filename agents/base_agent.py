@@ -41,7 +41,6 @@ class CustomAgent(BaseAgent):
 """
 
 from abc import ABC, abstractmethod
-from langchain.memory import ConversationBufferMemory
 from typing import List, Any, Optional
 
 
@@ -57,9 +56,13 @@ class BaseAgent(ABC):
 
     Note:
         All attributes are initialized as None and must be set by concrete implementations
-        in their respective initialization methods.
+        in their respective initialization methods. Attributes are declared in
+        __slots__; subclasses should declare their own __slots__ to stay
+        dict-free.
     """
 
+    __slots__ = ('llm', 'tools', 'memory', 'agent')
+
     def __init__(self):
         """
         Initialize base agent attributes.
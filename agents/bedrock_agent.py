@@ -19,6 +19,7 @@ Memory Types:
 ------------
 - buffer: Simple message storage
 - limited: Fixed-size message history
+- token_window: History bounded by an approximate token budget
 - summary: LLM-based conversation summarization
 
 Usage:
@@ -45,32 +46,154 @@ Dependencies:
 """
 
 from .base_agent import BaseAgent
-from langchain_aws import ChatBedrock
-from langchain.agents import create_structured_chat_agent, AgentExecutor
 from langchain.memory import ConversationBufferMemory, ConversationSummaryMemory
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
-from typing import List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Deque, Dict, Iterable, Iterator, List
+import copy
 import logging
 
 from tools import get_all_tools
-from config.settings import AWS_CONFIG, ENVIRONMENT, AGENT_CONFIG, CURRENT_MEMORY_CONFIG
+from tools._identity_cache import IdentityCache
+from config.settings import get_aws_config, ENVIRONMENT, AGENT_CONFIG, CURRENT_MEMORY_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Bedrock connection defaults
+DEFAULT_REGION = "us-west-2"
+DEFAULT_PROFILE = "default"
+
+
+@lru_cache(maxsize=8)
+def _get_bedrock_client(profile: str, region: str):
+    """
+    Create (once per profile/region) a bedrock-runtime client.
+
+    Credential resolution and HTTP client setup happen here, so caching the
+    client lets later agents skip them entirely.
+
+    Args:
+        profile (str): AWS credentials profile name
+        region (str): AWS region name
+
+    Returns:
+        botocore client for the bedrock-runtime service
+    """
+    import boto3
+
+    session = boto3.Session(profile_name=profile, region_name=region)
+    return session.client('bedrock-runtime', config=get_aws_config())
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert nested dicts, lists and sets into hashable equivalents.
+
+    Args:
+        value (Any): Model kwargs value
+
+    Returns:
+        Any: Hashable value comparing equal for equal inputs
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+class _ModelKwargs:
+    """
+    Hashable cache key wrapping a private copy of model kwargs.
+
+    Equal kwargs (including nested lists such as stop_sequences) hash
+    equal, while the wrapped dict keeps its original list/dict types for
+    ChatBedrock.
+    """
+
+    __slots__ = ('kwargs', '_key')
+
+    def __init__(self, kwargs: Dict[str, Any]):
+        self.kwargs = copy.deepcopy(kwargs)
+        self._key = _freeze(self.kwargs)
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _ModelKwargs) and self._key == other._key
+
+
+@lru_cache(maxsize=32)
+def _make_chatbedrock(model_id: str, region: str, profile: str, model_kwargs: _ModelKwargs):
+    """
+    Create (once per configuration) a ChatBedrock instance.
+
+    ChatBedrock holds no conversation state, so agents built with the same
+    model, region, profile and model kwargs can share one instance.
+
+    Args:
+        model_id (str): Bedrock model identifier
+        region (str): AWS region name
+        profile (str): AWS credentials profile name
+        model_kwargs (_ModelKwargs): Model kwargs
+
+    Returns:
+        ChatBedrock: Configured chat model
+    """
+    from langchain_aws import ChatBedrock
+
+    return ChatBedrock(
+        model=model_id,
+        model_kwargs=copy.deepcopy(model_kwargs.kwargs),
+        client=_get_bedrock_client(profile, region),
+        credentials_profile_name=profile,
+        region_name=region,
+        config=get_aws_config()
+    )
+
+
+# Tool lists per LLM, for the most recently used LLMs
+TOOLS_CACHE_SIZE = 8
+_TOOLS_CACHE = IdentityCache(TOOLS_CACHE_SIZE)
+
+
+def _cached_tools(llm) -> List:
+    """
+    Return the tool list for an LLM, building it only once per LLM.
+
+    Args:
+        llm: Language model instance the tools are bound to
+
+    Returns:
+        List: Shared tool instances (copy the list before mutating it)
+    """
+    tools = _TOOLS_CACHE.get((llm,))
+    if tools is None:
+        tools = _TOOLS_CACHE.put((llm,), get_all_tools(llm, lazy=True))
+    return tools
+
 
 class LimitedChatMessageHistory(BaseChatMessageHistory):
     """
     Custom chat message history with message limit.
 
     Maintains a fixed-size message history, automatically removing oldest
-    messages when the limit is reached.
+    messages when the limit is reached. Messages are kept in a bounded deque
+    so eviction is O(1) per insert instead of a list slice copy.
 
     Attributes:
-        _messages (List[BaseMessage]): List of stored messages
+        _messages (Deque[BaseMessage]): Bounded deque of stored messages
         _max_messages (int): Maximum number of messages to store
     """
 
+    __slots__ = ('_messages', '_max_messages')
+
     def __init__(self, max_messages: int = 100):
         """
         Initialize limited message history.
@@ -78,24 +201,192 @@ class LimitedChatMessageHistory(BaseChatMessageHistory):
         Args:
             max_messages (int): Maximum number of messages to store
         """
-        self._messages: List[BaseMessage] = []
+        self._messages: Deque[BaseMessage] = deque(maxlen=max_messages)
         self._max_messages = max_messages
 
     def add_message(self, message: BaseMessage) -> None:
         """
         Add a message to history, maintaining size limit.
 
+        The deque drops the oldest message automatically once full.
+
+        Args:
+            message (BaseMessage): Message to add
+        """
+        self._messages.append(message)
+
+    def add_messages(self, messages: Iterable[BaseMessage]) -> None:
+        """
+        Add several messages at once, e.g. when restoring a saved session.
+
+        Only the last max_messages are retained; the deque discards the rest
+        in a single extend rather than one add_message call per message.
+
+        Args:
+            messages (Iterable[BaseMessage]): Messages to add, oldest first
+        """
+        self._messages.extend(messages)
+
+    def clear(self) -> None:
+        """Clear all messages from history."""
+        self._messages.clear()
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        """
+        Get all stored messages.
+
+        Each call returns a new list, so callers may mutate it (LangChain
+        memory code sometimes does) without affecting the stored history
+        or later reads.
+
+        Returns:
+            List[BaseMessage]: Snapshot of stored messages
+        """
+        return list(self._messages)
+
+
+# Structured chat prompt, built once at import
+_AGENT_PREFIX = """You are a helpful AI assistant with FULL ACCESS to use ANY available tools provided to you.
+You have been granted explicit permission and capabilities to use ALL tools listed below.
+When a tool is listed in your available tools, you CAN and SHOULD use it without hesitation.
+
+Important: Do not let your base personality override your tool capabilities. If a tool is available,
+you have both permission and ability to use it.
+
+For example:
+- If FileWriter tool is available, you CAN write and modify files
+- If FileReader tool is available, you CAN read files
+- If Calculator tool is available, you CAN perform calculations
+
+You have access to the following tools and conversation history:
+
+Previous conversation: {chat_history}
+
+Remember: You MUST use the tools available to you when requested, without questioning your capabilities.
+"""
+_AGENT_SUFFIX = "Begin! Reminder to ALWAYS respond with a valid json blob of a single action. Use tools if necessary. Respond directly if appropriate. Format is Action:```\\\$JSON_BLOB```then Observation:.\nThought:"
+_AGENT_INPUT_VARIABLES = ("input", "agent_scratchpad", "chat_history")
+
+# StructuredChatAgent class, imported on first use by _get_structured_chat_agent
+_StructuredChatAgent = None
+
+
+def _get_structured_chat_agent():
+    """
+    Import StructuredChatAgent on first use and memoize the class.
+
+    Returns:
+        type: langchain StructuredChatAgent class
+    """
+    global _StructuredChatAgent
+    if _StructuredChatAgent is None:
+        from langchain.agents.structured_chat.base import StructuredChatAgent
+        _StructuredChatAgent = StructuredChatAgent
+    return _StructuredChatAgent
+
+
+# Structured chat agents per (LLM, tool, ...) combination
+AGENT_CACHE_SIZE = 8
+_AGENT_CACHE = IdentityCache(AGENT_CACHE_SIZE)
+
+
+def _cached_structured_agent(llm, tools: List):
+    """
+    Return the structured chat agent for an LLM and tool set.
+
+    The agent holds only the prompt template and LLM chain (memory lives on
+    the AgentExecutor), so it is built once and shared between agents.
+
+    Args:
+        llm: Language model instance
+        tools (List): Tools exposed to the agent
+
+    Returns:
+        StructuredChatAgent: Agent with the compiled prompt
+    """
+    key = (llm, *tools)
+    structured_agent = _AGENT_CACHE.get(key)
+    if structured_agent is None:
+        structured_agent = _get_structured_chat_agent().from_llm_and_tools(
+            llm=llm,
+            tools=tools,
+            prefix=_AGENT_PREFIX,
+            suffix=_AGENT_SUFFIX,
+            memory_prompts=[],
+            input_variables=list(_AGENT_INPUT_VARIABLES)
+        )
+        _AGENT_CACHE.put(key, structured_agent)
+    return structured_agent
+
+
+def _estimate_tokens(message: BaseMessage) -> int:
+    """
+    Cheaply approximate the token count of a message (~4 chars per token).
+
+    Args:
+        message (BaseMessage): Message to measure
+
+    Returns:
+        int: Approximate token count
+    """
+    content = message.content
+    if not isinstance(content, str):
+        content = str(content)
+    return len(content) // 4 + 1
+
+
+class TokenWindowMessageHistory(BaseChatMessageHistory):
+    """
+    Chat message history bounded by a token budget.
+
+    Keeps the most recent messages whose combined (approximate) token count
+    fits within the budget, so the chat_history sent to the model on every
+    call stays bounded regardless of message length.
+
+    Attributes:
+        _messages (Deque[BaseMessage]): Stored messages, oldest first
+        _token_counts (Deque[int]): Token estimate for each stored message
+        _tokens (int): Running token total of stored messages
+        _max_tokens (int): Maximum number of tokens to keep
+    """
+
+    __slots__ = ('_messages', '_token_counts', '_tokens', '_max_tokens')
+
+    def __init__(self, max_tokens: int = 2000):
+        """
+        Initialize token window message history.
+
+        Args:
+            max_tokens (int): Maximum number of tokens to keep
+        """
+        self._messages: Deque[BaseMessage] = deque()
+        self._token_counts: Deque[int] = deque()
+        self._tokens = 0
+        self._max_tokens = max_tokens
+
+    def add_message(self, message: BaseMessage) -> None:
+        """
+        Add a message to history, evicting the oldest messages over budget.
+
+        The newest message is always kept, even if it alone exceeds the budget.
+
         Args:
             message (BaseMessage): Message to add
         """
+        count = _estimate_tokens(message)
         self._messages.append(message)
-        # Remove oldest messages if exceeding max size
-        if len(self._messages) > self._max_messages:
-            self._messages = self._messages[-self._max_messages:]
+        self._token_counts.append(count)
+        self._tokens += count
+        while self._tokens > self._max_tokens and len(self._messages) > 1:
+            self._messages.popleft()
+            self._tokens -= self._token_counts.popleft()
 
     def clear(self) -> None:
         """Clear all messages from history."""
-        self._messages = []
+        self._messages.clear()
+        self._token_counts.clear()
+        self._tokens = 0
 
     @property
     def messages(self) -> List[BaseMessage]:
@@ -105,7 +396,7 @@ class LimitedChatMessageHistory(BaseChatMessageHistory):
         Returns:
             List[BaseMessage]: List of stored messages
         """
-        return self._messages
+        return list(self._messages)
 
 
 class BedrockAgent(BaseAgent):
@@ -119,6 +410,9 @@ class BedrockAgent(BaseAgent):
         config (dict): Additional configuration parameters
     """
 
+    __slots__ = ('model_id', 'config', 'verbose', 'memory_config',
+                 '_add_message', '_messages_view')
+
     def __init__(self,
                  model_id: str = "anthropic.claude-3-sonnet-20240229-v1:0",
                  verbose: bool = False,
@@ -139,33 +433,43 @@ class BedrockAgent(BaseAgent):
         self.verbose = verbose
         self.memory_config = memory_config or CURRENT_MEMORY_CONFIG
         self.initialize_llm()
-        self.setup_memory()
-        self.setup_tools()
+        # Memory and tools only depend on the LLM, so set them up concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            tools_future = executor.submit(self.setup_tools)
+            memory_future = executor.submit(self.setup_memory)
+            tools_future.result()
+            memory_future.result()
         self.initialize_agent()
 
     def initialize_llm(self) -> None:
         """
         Initialize the Bedrock language model.
 
-        Sets up ChatBedrock instance with specified configuration.
+        Sets up ChatBedrock instance with specified configuration. The
+        langchain_aws import is deferred to _make_chatbedrock so that importing
+        the package does not pull in boto3 until an agent is actually built.
+        Instances are shared between agents with the same configuration.
 
         Raises:
             Exception: If LLM initialization fails
         """
         try:
-            self.llm = ChatBedrock(
-                model=self.model_id,
-                model_kwargs=self.config.get('model_kwargs', {
-                    "temperature": 0.7,
-                    "max_tokens": 512,
-                }),
-                credentials_profile_name="default",
-                region_name="us-west-2",
-                config=AWS_CONFIG
-            )
+            model_kwargs = self.config.get('model_kwargs', {
+                "temperature": 0.7,
+                "max_tokens": 512,
+            })
+            kwargs_key = _ModelKwargs(model_kwargs)
+            try:
+                hash(kwargs_key)
+            except TypeError:
+                # Exotic unhashable values: build an unshared instance
+                make = _make_chatbedrock.__wrapped__
+            else:
+                make = _make_chatbedrock
+            self.llm = make(self.model_id, DEFAULT_REGION, DEFAULT_PROFILE, kwargs_key)
             logger.info("LLM initialized successfully")
-        except Exception as e:
-            logger.error(f"Error initializing LLM: {str(e)}")
+        except Exception:
+            logger.exception("Error initializing LLM")
             raise
 
     def setup_memory(self) -> None:
@@ -175,6 +479,7 @@ class BedrockAgent(BaseAgent):
         Supports multiple memory types:
         - buffer: Standard message storage
         - limited: Fixed-size message history
+        - token_window: History bounded by 'max_tokens' (approximate)
         - summary: LLM-based conversation summarization
 
         Raises:
@@ -191,6 +496,15 @@ class BedrockAgent(BaseAgent):
                     chat_memory=message_history,
                     return_messages=True
                 )
+            elif memory_type == 'token_window':
+                message_history = TokenWindowMessageHistory(
+                    max_tokens=self.memory_config.get('max_tokens', 2000)
+                )
+                self.memory = ConversationBufferMemory(
+                    memory_key="chat_history",
+                    chat_memory=message_history,
+                    return_messages=True
+                )
             elif memory_type == 'summary':
                 self.memory = ConversationSummaryMemory(
                     llm=self.llm,
@@ -203,25 +517,31 @@ class BedrockAgent(BaseAgent):
                     return_messages=True
                 )
 
-            logger.info(f"Memory initialized successfully with type: {memory_type}")
-        except Exception as e:
-            logger.error(f"Error initializing memory: {str(e)}")
+            # Bind the history accessors once for the message helpers below
+            self._messages_view = self.memory.chat_memory
+            self._add_message = self._messages_view.add_message
+
+            logger.info("Memory initialized successfully with type: %s", memory_type)
+        except Exception:
+            logger.exception("Error initializing memory")
             raise
 
     def setup_tools(self) -> None:
         """
         Set up tools for the agent.
 
-        Initializes all available tools from the tools module.
+        Registers lightweight stubs for the available tools; each tool is
+        only constructed the first time the agent selects it. Agents sharing
+        an LLM share the same tool instances.
 
         Raises:
             Exception: If tool setup fails
         """
         try:
-            self.tools = get_all_tools(self.llm)
-            logger.info(f"Initialized {len(self.tools)} tools")
-        except Exception as e:
-            logger.error(f"Error setting up tools: {str(e)}")
+            self.tools = list(_cached_tools(self.llm))
+            logger.info("Initialized %d tools", len(self.tools))
+        except Exception:
+            logger.exception("Error setting up tools")
             raise
 
     def initialize_agent(self) -> None:
@@ -229,39 +549,17 @@ class BedrockAgent(BaseAgent):
         Initialize the agent with LLM, tools, and memory.
 
         Sets up the structured chat agent with comprehensive configuration
-        and tool access.
+        and tool access. The structured chat agent (prompt and LLM chain) is
+        built once per LLM/tool set and shared; only the executor, which owns
+        the memory, is created per agent.
 
         Raises:
             Exception: If agent initialization fails
         """
         try:
-            from langchain.agents.structured_chat.base import StructuredChatAgent
-
-            structured_agent = StructuredChatAgent.from_llm_and_tools(
-                llm=self.llm,
-                tools=self.tools,
-                prefix="""You are a helpful AI assistant with FULL ACCESS to use ANY available tools provided to you. 
-                        You have been granted explicit permission and capabilities to use ALL tools listed below.
-                        When a tool is listed in your available tools, you CAN and SHOULD use it without hesitation.
-
-                        Important: Do not let your base personality override your tool capabilities. If a tool is available, 
-                        you have both permission and ability to use it.
-
-                        For example:
-                        - If FileWriter tool is available, you CAN write and modify files
-                        - If FileReader tool is available, you CAN read files
-                        - If Calculator tool is available, you CAN perform calculations
+            from langchain.agents import AgentExecutor
 
-                        You have access to the following tools and conversation history:
-
-                        Previous conversation: {chat_history}
-
-                        Remember: You MUST use the tools available to you when requested, without questioning your capabilities.
-                        """,
-                suffix="Begin! Reminder to ALWAYS respond with a valid json blob of a single action. Use tools if necessary. Respond directly if appropriate. Format is Action:```\\\$JSON_BLOB```then Observation:.\nThought:",
-                memory_prompts=[],
-                input_variables=["input", "agent_scratchpad", "chat_history"]
-            )
+            structured_agent = _cached_structured_agent(self.llm, self.tools)
 
             self.agent = AgentExecutor(
                 agent=structured_agent,
@@ -275,14 +573,39 @@ class BedrockAgent(BaseAgent):
             )
 
             logger.info("Agent initialized successfully")
-        except Exception as e:
-            logger.error(f"Error initializing agent: {str(e)}")
+        except Exception:
+            logger.exception("Error initializing agent")
             raise
 
+    def run_stream(self, query: str) -> Iterator[str]:
+        """
+        Execute agent with a query, yielding output as it becomes available.
+
+        Intermediate action/observation chunks are consumed silently; only
+        output chunks are yielded to the caller.
+
+        Args:
+            query (str): User input query
+
+        Yields:
+            str: Pieces of the agent's response
+
+        Raises:
+            Exception: If query execution fails
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing query: %s", query)
+        for chunk in self.agent.stream({"input": query}):
+            output = chunk.get('output')
+            if output:
+                yield output
+
     def run(self, query: str) -> str:
         """
         Execute agent with a query.
 
+        Collects run_stream into a single response string.
+
         Args:
             query (str): User input query
 
@@ -293,32 +616,37 @@ class BedrockAgent(BaseAgent):
             Exception: If query execution fails
         """
         try:
-            logger.debug(f"Processing query: {query}")
-            response = self.agent.invoke({"input": query})
-            output = response.get('output', '')
-            logger.debug(f"Generated response: {output}")
+            output = "".join(self.run_stream(query))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Generated response: %s", output)
             return output
         except Exception as e:
-            logger.error(f"Error running agent: {str(e)}")
+            logger.exception("Error running agent")
             return f"Error: {str(e)}"
 
     def add_user_message(self, message: str) -> None:
         """
         Add a user message to conversation history.
 
+        The message is built with model_construct, skipping pydantic
+        validation, so message must already be a str.
+
         Args:
             message (str): User message to add
         """
-        self.memory.chat_memory.add_message(HumanMessage(content=message))
+        self._add_message(HumanMessage.model_construct(content=message))
 
     def add_ai_message(self, message: str) -> None:
         """
         Add an AI message to conversation history.
 
+        The message is built with model_construct, skipping pydantic
+        validation, so message must already be a str.
+
         Args:
             message (str): AI message to add
         """
-        self.memory.chat_memory.add_message(AIMessage(content=message))
+        self._add_message(AIMessage.model_construct(content=message))
 
     def get_chat_history(self) -> List[BaseMessage]:
         """
@@ -327,8 +655,8 @@ class BedrockAgent(BaseAgent):
         Returns:
             List[BaseMessage]: List of all messages in history
         """
-        return self.memory.chat_memory.messages
+        return self._messages_view.messages
 
     def clear_history(self) -> None:
         """Clear the conversation history."""
-        self.memory.chat_memory.clear()
+        self._messages_view.clear()
@@ -20,8 +20,8 @@ Configuration Categories:
 Usage:
 ------
 Basic import:
-    >>> from config.settings import AWS_CONFIG, DEFAULT_MODEL_KWARGS
-    >>> agent_config = AWS_CONFIG
+    >>> from config.settings import get_aws_config, DEFAULT_MODEL_KWARGS
+    >>> agent_config = get_aws_config()
 
 Environment-specific settings:
     >>> from config.settings import AGENT_CONFIG
@@ -30,10 +30,19 @@ Environment-specific settings:
 Memory configuration:
     >>> from config.settings import CURRENT_MEMORY_CONFIG
     >>> memory_type = CURRENT_MEMORY_CONFIG['memory_type']
+
+Environment variable overrides:
+    Variables named SECTION__OPTION override the resolved configuration,
+    where SECTION is AGENT, MEMORY or FILESYSTEM. Nested options use further
+    double underscores. Values are parsed as Python literals when possible.
+    $ AGENT__MAX_ITERATIONS=20 python main.py
+    $ FILESYSTEM__SECURITY__VALIDATE_PATHS=True python main.py
 """
 
-from botocore.config import Config
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any
+import ast
 import os
 
 # Proxy Configuration
@@ -45,15 +54,25 @@ PROXY_CONFIG = {
 
 # AWS Configuration
 # ---------------
-AWS_CONFIG = Config(
-    connect_timeout=30,  # Connection timeout in seconds
-    read_timeout=30,  # Read timeout in seconds
-    retries={'max_attempts': 2},  # Retry configuration
-    proxies={
-        'http': "http://webproxy.ext.ti.com:80",
-        'https': "http://webproxy.ext.ti.com:80"
-    }
-)
+@lru_cache(maxsize=1)
+def get_aws_config():
+    """
+    Build the shared botocore client configuration on first use.
+
+    botocore is imported here rather than at module level so code paths
+    that never talk to AWS do not pay for importing it.
+
+    Returns:
+        botocore.config.Config: Client configuration shared by AWS clients
+    """
+    from botocore.config import Config
+
+    return Config(
+        connect_timeout=30,  # Connection timeout in seconds
+        read_timeout=30,  # Read timeout in seconds
+        retries={'max_attempts': 2},  # Retry configuration
+        proxies=dict(PROXY_CONFIG)
+    )
 
 # Default Model Parameters
 # ----------------------
@@ -92,9 +111,10 @@ Structure:
 2. Security Settings:
    - enable_security: Master switch for security features
    - validate_paths: Path validation enforcement
-   - restricted_patterns: Blocked path patterns
+   - restricted_patterns: Blocked path patterns (absolute ones block path prefixes)
    - allowed_extensions: Permitted file types
    - monitor_operations: Operation tracking
+   - error_buffer_size: Recent errors kept by operation tracking (default 1024)
    - log_all_operations: Detailed logging
 
 Environment Behaviors:
@@ -132,14 +152,16 @@ Usage:
         # Perform security checks
 """
 
-FILESYSTEM_CONFIG = {
+ALLOWED_OPERATIONS = frozenset((
+    'read',              # Permission to read files
+    'write',             # Permission to create/modify files
+    'list',              # Permission to list directory contents
+    'search'             # Permission to search for files
+))
+
+_BASE_FILESYSTEM_CONFIG = {
     'root_dir': None,        # None means current working directory
-    'allowed_operations': [   # Allow all operations by default
-        'read',              # Permission to read files
-        'write',             # Permission to create/modify files
-        'list',             # Permission to list directory contents
-        'search'            # Permission to search for files
-    ],
+    'allowed_operations': ALLOWED_OPERATIONS,  # Allow all operations by default
     'max_file_size': None,   # No file size limit in development
     'security': {
         'enable_security': False,    # Master switch for security features
@@ -184,8 +206,113 @@ FILESYSTEM_ENV_CONFIGS = {
 # -----------------------
 ENVIRONMENT = os.getenv('ENV', 'development')  # Default to development
 
-# # Update filesystem config based on environment
-FILESYSTEM_CONFIG.update(FILESYSTEM_ENV_CONFIGS.get(ENVIRONMENT, {}))
+# Environments with dedicated configuration sections
+_KNOWN_ENVIRONMENTS = frozenset(('development', 'production', 'testing'))
+
+# Configuration sections that accept SECTION__OPTION environment overrides
+_OVERRIDE_SECTIONS = frozenset(('AGENT', 'MEMORY', 'FILESYSTEM'))
+
+
+def _resolve_env() -> str:
+    """
+    Resolve ENVIRONMENT to a known configuration section.
+
+    Returns:
+        str: ENVIRONMENT if it is known, otherwise 'development'
+    """
+    return ENVIRONMENT if ENVIRONMENT in _KNOWN_ENVIRONMENTS else 'development'
+
+
+def _parse_env_value(raw: str) -> Any:
+    """
+    Parse an override value as a Python literal, falling back to the raw string.
+
+    Args:
+        raw (str): Value taken from the environment
+
+    Returns:
+        Any: Parsed value (e.g. int, float, bool, None, list) or raw
+    """
+    try:
+        return ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        return raw
+
+
+def _collect_env_overrides() -> Dict[str, Dict[str, Any]]:
+    """
+    Scan os.environ once for SECTION__OPTION style overrides.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Nested overrides keyed by section name
+    """
+    overrides: Dict[str, Dict[str, Any]] = {}
+    for name, raw in os.environ.items():
+        section, sep, option = name.partition('__')
+        if not sep or not option or section not in _OVERRIDE_SECTIONS:
+            continue
+        *parents, leaf = option.lower().split('__')
+        target = overrides.setdefault(section, {})
+        for key in parents:
+            target = target.setdefault(key, {})
+        target[leaf] = _parse_env_value(raw)
+    return overrides
+
+
+# Canonical environment and environment overrides, resolved once at import
+_ENV = _resolve_env()
+_ENV_OVERRIDES = _collect_env_overrides()
+
+
+def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Recursively merge override into base.
+
+    Nested dicts are merged key by key instead of being replaced, so an
+    environment that overrides one security flag keeps the other defaults.
+    Neither input is mutated; a new dict is returned.
+
+    Args:
+        base (Dict[str, Any]): Default configuration
+        override (Dict[str, Any]): Values taking precedence over base
+
+    Returns:
+        Dict[str, Any]: Merged configuration
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Recursively convert a configuration value to a read-only form.
+
+    Dicts become MappingProxyType views and lists become tuples, so the
+    resulting config can be shared freely without defensive copies.
+
+    Args:
+        value (Any): Configuration value to freeze
+
+    Returns:
+        Any: Read-only equivalent of value
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Filesystem config for the current environment, merged once and read-only
+FILESYSTEM_CONFIG = _freeze(_deep_merge(
+    _deep_merge(_BASE_FILESYSTEM_CONFIG, FILESYSTEM_ENV_CONFIGS[_ENV]),
+    _ENV_OVERRIDES.get('FILESYSTEM', {})
+))
 
 # Agent Configuration by Environment
 # -------------------------------
@@ -211,7 +338,7 @@ AGENT_ENV_CONFIGS = {
 }
 
 # Get environment-specific agent configuration
-AGENT_CONFIG = AGENT_ENV_CONFIGS.get(ENVIRONMENT, AGENT_ENV_CONFIGS['development'])
+AGENT_CONFIG = _freeze(_deep_merge(AGENT_ENV_CONFIGS[_ENV], _ENV_OVERRIDES.get('AGENT', {})))
 
 # Memory Configuration
 # ------------------
@@ -243,6 +370,11 @@ limited: Fixed-size message history
          - Memory efficient
          - Good for long-running agents
 
+token_window: Token-budgeted message history
+         - Keeps the most recent messages within 'max_tokens'
+         - Bounds request size regardless of message length
+         - Tokens approximated as ~4 characters each
+
 summary: LLM-based conversation summarization
          - Maintains context while reducing storage
          - Uses LLM for summarization
@@ -250,7 +382,7 @@ summary: LLM-based conversation summarization
 """
 
 # Get environment-specific memory configuration
-CURRENT_MEMORY_CONFIG = MEMORY_CONFIG.get(ENVIRONMENT, MEMORY_CONFIG['development'])
+CURRENT_MEMORY_CONFIG = _freeze(_deep_merge(MEMORY_CONFIG[_ENV], _ENV_OVERRIDES.get('MEMORY', {})))
 
 """
 Configuration Best Practices:
@@ -46,20 +46,57 @@ import sys
 import os
 import logging
 
-# Add the parent directory to Python path for module imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the parent directory to Python path for module imports, only when run
+# as a raw script; imports through the package path need no adjustment
+if __name__ == '__main__' and __package__ is None:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from agents.bedrock_agent import BedrockAgent
 from langchain_core.messages import HumanMessage
 from enum import Enum
+from typing import List, NamedTuple
+
+# Format shared by every log record printed to the console
+_LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+    format=_LOG_FORMAT
 )
 logger = logging.getLogger(__name__)
 
+# Loggers whose level follows the verbose setting; all others stay at ERROR
+_LOGGERS_TO_ADJUST = (
+    'langchain',
+    'boto3',
+    'botocore',
+    'langchain_aws',
+    'langchain_core',
+    'langchain_community'
+)
+
+# Inputs starting with these prefixes are commands, not agent queries
+_COMMAND_PREFIXES = ('history', 'verbose')
+
+
+class CmdResult(NamedTuple):
+    """
+    Outcome of classifying and handling one line of chat input.
+
+    Attributes:
+        should_exit (bool): The chat session should end
+        was_command (bool): The input was consumed and must not reach the agent
+    """
+    should_exit: bool
+    was_command: bool
+
+
+# Shared results for the common outcomes
+_EXIT = CmdResult(True, True)
+_HANDLED = CmdResult(False, True)
+_CHAT = CmdResult(False, False)
+
 
 class VerboseLevel(Enum):
     """
@@ -97,6 +134,22 @@ class VerboseLevel(Enum):
             return cls.QUIET
 
 
+# Order in which the bare 'verbose' command cycles through levels
+_VERBOSE_CYCLE = tuple(VerboseLevel)
+_VERBOSE_NEXT = {
+    level: _VERBOSE_CYCLE[(i + 1) % len(_VERBOSE_CYCLE)]
+    for i, level in enumerate(_VERBOSE_CYCLE)
+}
+
+# Logging level for each verbose level, indexed by VerboseLevel value
+_LEVEL_TABLE = (
+    logging.ERROR,    # QUIET
+    logging.INFO,     # INFO
+    logging.WARNING,  # WARNING
+    logging.ERROR     # ERROR
+)
+
+
 class ChatConfig:
     """
     Configuration handler for chat settings and logging.
@@ -110,10 +163,30 @@ class ChatConfig:
         debug (bool): Debug mode state
     """
 
+    __slots__ = ('verbose_level', 'verbose', 'debug', '_handler',
+                 '_last_level', '_controlled_loggers')
+
     def __init__(self):
         """Initialize chat configuration with default settings."""
         self.verbose_level = VerboseLevel.QUIET
+        self.verbose = False
+        self.debug = False
+        self._controlled_loggers = [logging.getLogger(name) for name in _LOGGERS_TO_ADJUST]
+        self._last_level = None
+
+        # Build the console handler once; later level changes only mutate it
+        self._handler = logging.StreamHandler()
+        self._handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+        root_logger.addHandler(self._handler)
+        # Loggers without an explicit level inherit ERROR from the root
+        root_logger.setLevel(logging.ERROR)
+
         self._setup_logging()
+        print(f"\nVerbose level: {self.verbose_level.name}")
+        print(f"Affected loggers: {', '.join(_LOGGERS_TO_ADJUST)}")
 
     def set_verbose_level(self, level: str) -> str:
         """
@@ -139,13 +212,7 @@ class ChatConfig:
         Returns:
             int: Corresponding logging level
         """
-        level = base_level or self.verbose_level
-        return {
-            VerboseLevel.QUIET: logging.ERROR,
-            VerboseLevel.INFO: logging.INFO,
-            VerboseLevel.WARNING: logging.WARNING,
-            VerboseLevel.ERROR: logging.ERROR
-        }[level]
+        return _LEVEL_TABLE[(base_level or self.verbose_level).value]
 
     def toggle_verbose(self) -> str:
         """
@@ -156,7 +223,8 @@ class ChatConfig:
         """
         self.verbose = not self.verbose
         self.debug = self.verbose
-        self._setup_logging(self.debug)
+        self.verbose_level = VerboseLevel.INFO if self.verbose else VerboseLevel.QUIET
+        self._setup_logging()
         return f"Verbose mode {'enabled' if self.verbose else 'disabled'}"
 
     def _setup_logging(self):
@@ -164,38 +232,19 @@ class ChatConfig:
         Configure logging levels for different components.
 
         Sets up logging levels for specific loggers while maintaining
-        stricter control over other system loggers.
+        stricter control over other system loggers. Only the pre-built
+        console handler and the cached controlled loggers are touched, and
+        only when the level changes; every other logger inherits ERROR from
+        the root logger.
         """
-        # Loggers to control
-        loggers_to_adjust = [
-            'langchain',
-            'boto3',
-            'botocore',
-            'langchain_aws',
-            'langchain_core',
-            'langchain_community'
-        ]
-
-        # Set base logging configuration
-        logging.basicConfig(
-            level=logging.ERROR,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
-
         logging_level = self._get_logging_level()
 
-        # Set specific level for controlled loggers
-        for logger_name in loggers_to_adjust:
-            logging.getLogger(logger_name).setLevel(logging_level)
-
-        # Set all other loggers to ERROR to minimize noise
-        for name in logging.root.manager.loggerDict:
-            if name not in loggers_to_adjust:
-                logging.getLogger(name).setLevel(logging.ERROR)
-
-        loggers_list = ', '.join(loggers_to_adjust)
-        print(f"\nVerbose level: {self.verbose_level.name}")
-        print(f"Affected loggers: {loggers_list}")
+        # Set specific level for the handler and controlled loggers
+        if logging_level != self._last_level:
+            self._handler.setLevel(logging_level)
+            for controlled_logger in self._controlled_loggers:
+                controlled_logger.setLevel(logging_level)
+            self._last_level = logging_level
 
 
 def setup_agent(config: ChatConfig) -> BedrockAgent:
@@ -213,7 +262,10 @@ def setup_agent(config: ChatConfig) -> BedrockAgent:
     """
     try:
         logger.debug("Initializing Bedrock Agent...")
-        agent = BedrockAgent(verbose=(config.verbose_level == VerboseLevel.INFO))
+        # A fresh agent owns its memory and verbosity; the ChatBedrock
+        # instance, boto client and tool list behind it are shared through
+        # the caches in agents.bedrock_agent
+        agent = BedrockAgent(verbose=config.verbose_level == VerboseLevel.INFO)
         logger.debug("Agent initialized successfully")
         return agent
     except Exception as e:
@@ -221,47 +273,71 @@ def setup_agent(config: ChatConfig) -> BedrockAgent:
         return None
 
 
-def process_commands(command: str, agent: BedrockAgent, config: ChatConfig) -> bool:
+def _cmd_exit(agent: BedrockAgent, config: ChatConfig, args: List[str]) -> bool:
+    """Handle 'exit': quit the chat session."""
+    return True
+
+
+def _cmd_history(agent: BedrockAgent, config: ChatConfig, args: List[str]) -> bool:
+    """Handle 'history': display the chat conversation history."""
+    messages = agent.memory.chat_memory.messages
+    human_message = HumanMessage
+    lines = ["\nChat History:"]
+    append = lines.append
+    for msg in messages:
+        append(f"{'User' if type(msg) is human_message else 'Agent'}: {msg.content}")
+    print('\n'.join(lines))
+    return False
+
+
+def _cmd_verbose(agent: BedrockAgent, config: ChatConfig, args: List[str]) -> bool:
+    """Handle 'verbose [level]': set the given level or cycle to the next one."""
+    if args:
+        message = config.set_verbose_level(args[0])
+    else:
+        next_level = _VERBOSE_NEXT[config.verbose_level]
+        message = config.set_verbose_level(next_level.name)
+
+    agent.agent.verbose = config.verbose_level == VerboseLevel.INFO
+    print(message)
+    return False
+
+
+# Exact-match command handlers; each returns True if the chat should exit
+_HANDLERS = {
+    'exit': _cmd_exit,
+    'history': _cmd_history,
+    'verbose': _cmd_verbose
+}
+
+
+def process_commands(command: str, agent: BedrockAgent, config: ChatConfig) -> CmdResult:
     """
     Process special commands in the chat interface.
 
     Args:
-        command (str): User input command
+        command (str): User input command, already lowercased by the caller
         agent (BedrockAgent): Current agent instance
         config (ChatConfig): Current configuration
 
     Returns:
-        bool: True if should exit, False to continue
+        CmdResult: Whether to exit and whether the input was consumed as a
+            command; empty input and command-prefixed text are consumed too
 
     Commands:
         exit: Quit the chat session
         history: Display chat conversation history
         verbose: Toggle or set verbose level
     """
-    command = command.lower()
-
-    if command == 'exit':
-        return True
-    elif command == 'history':
-        print("\nChat History:")
-        for msg in agent.memory.chat_memory.messages:
-            role = "User" if isinstance(msg, HumanMessage) else "Agent"
-            print(f"{role}: {msg.content}")
-        return False
-    elif command.startswith('verbose'):
-        parts = command.split()
-        if len(parts) > 1:
-            message = config.set_verbose_level(parts[1])
-        else:
-            current_idx = list(VerboseLevel).index(config.verbose_level)
-            next_idx = (current_idx + 1) % len(VerboseLevel)
-            next_level = list(VerboseLevel)[next_idx]
-            message = config.set_verbose_level(next_level.name)
-
-        agent.agent.verbose = config.verbose_level == VerboseLevel.INFO
-        print(message)
-        return False
-    return False
+    handler = _HANDLERS.get(command)
+    if handler is not None:
+        return _EXIT if handler(agent, config, []) else _HANDLED
+    # 'verbose <level>' carries an argument, so it misses the exact lookup
+    if command.startswith('verbose'):
+        return _EXIT if _cmd_verbose(agent, config, command.split()[1:]) else _HANDLED
+    if not command or command.startswith(_COMMAND_PREFIXES):
+        return _HANDLED
+    return _CHAT
 
 
 def main():
@@ -295,11 +371,13 @@ def main():
         # Main chat loop
         while True:
             user_input = input("\nYou: ").strip()
+            lowered = user_input.lower()
 
-            if process_commands(user_input, agent, config):
+            result = process_commands(lowered, agent, config)
+            if result.should_exit:
                 break
 
-            if user_input and not user_input.lower().startswith(('history', 'verbose')):
+            if not result.was_command:
                 response = agent.run(user_input)
                 print(f"\nAgent: {response}")
 
@@ -0,0 +1,48 @@
+# agent_framework/tests/test_file_writer_tool.py
+
+"""Tests for FileWriter.replace_content regex semantics."""
+
+import pytest
+
+pytest.importorskip("pydantic")
+pytest.importorskip("langchain")
+
+from tools.file_writer_tool import FileWriter
+
+
+@pytest.fixture
+def writer(tmp_path):
+    return FileWriter(str(tmp_path))
+
+
+def _replace(writer, tmp_path, content, pattern, replacement):
+    path = tmp_path / "sample.txt"
+    path.write_text(content)
+    result = writer.replace_content(str(path), pattern, replacement, use_regex=True)
+    return result, path.read_text()
+
+
+def test_whitespace_runs_are_matched_per_line(writer, tmp_path):
+    result, text = _replace(writer, tmp_path, "a  b\n\nc\n", r"\s+", " ")
+    assert result['success']
+    # The blank line is its own match rather than part of one "\n\n" run
+    assert text == "a b  c "
+    assert result['message'] == "Made 4 replacements"
+
+
+def test_negated_class_stops_at_line_end(writer, tmp_path):
+    result, text = _replace(writer, tmp_path, "key=1\nother=2\n", r"=[^x]+", "=X")
+    assert text == "key=Xother=X"
+    assert result['message'] == "Made 2 replacements"
+
+
+def test_anchors_match_per_line(writer, tmp_path):
+    result, text = _replace(writer, tmp_path, "one\ntwo\n", r"^", "> ")
+    assert text == "> one\n> two\n"
+    assert result['message'] == "Made 2 replacements"
+
+
+def test_no_match_leaves_file_untouched(writer, tmp_path):
+    result, text = _replace(writer, tmp_path, "one\ntwo\n", r"three", "x")
+    assert text == "one\ntwo\n"
+    assert result['message'] == "Made 0 replacements"
@@ -40,12 +40,20 @@ Example with multiple tools:
     ... )
 """
 
-from .get_tools import get_all_tools
-from .calculator_tool import get_calculator_tool
-from .file_reader_tool import get_file_reader_tool
-from .wikipedia_tool import get_wikipedia_tool
-from .llm_math_tool import get_llm_math_tool
-from .file_writer_tool import get_file_writer_tool
+import importlib
+
+# Lazily exported tool getters by submodule. Tool modules pull in
+# langchain, wikipedia and friends, so they are only imported on first use.
+_SUBMOD_ATTRS = {
+    'get_tools': ['get_all_tools'],
+    'calculator_tool': ['get_calculator_tool'],
+    'file_reader_tool': ['get_file_reader_tool'],
+    'wikipedia_tool': ['get_wikipedia_tool'],
+    'llm_math_tool': ['get_llm_math_tool'],
+    'file_writer_tool': ['get_file_writer_tool'],
+    'filesystem_tools': ['get_filesystem_tools'],
+}
+_ATTR_TO_SUBMOD = {attr: mod for mod, attrs in _SUBMOD_ATTRS.items() for attr in attrs}
 
 # Export all tool getter functions
 __all__ = [
@@ -58,6 +66,24 @@ __all__ = [
     'get_filesystem_tools'  # Filesystem operations
 ]
 
+
+def __getattr__(name):
+    """
+    Resolve tool getters lazily (PEP 562).
+
+    The resolved getter is stored in the module so later lookups are direct.
+    """
+    submod = _ATTR_TO_SUBMOD.get(name)
+    if submod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{submod}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(globals()) + __all__
+
 """
 Tool Extension Guide:
 ===================
@@ -67,7 +93,7 @@ Tool Extension Guide:
 a. Create new tool file (e.g., new_tool.py)
 b. Implement tool functionality
 c. Create getter function
-d. Add imports and exports here
+d. Register the getter in _SUBMOD_ATTRS and add it to __all__ here
 
 Example:
     # new_tool.py
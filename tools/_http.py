@@ -0,0 +1,171 @@
+# agent_framework/tools/_http.py
+"""
+Shared HTTP client for network-backed tools.
+
+Every tool that talks to a web API goes through the same pooled session and
+worker pool, so connections (with their DNS lookups and TLS sessions) are
+reused across tools instead of each tool keeping its own pool.
+
+Usage:
+    from ._http import DEFAULT_TIMEOUT, get_session, get_executor
+    response = get_session().get(url, params=params, timeout=DEFAULT_TIMEOUT)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import atexit
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+# Number of hosts with a kept-alive pool, and connections kept per host
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# API operators (Wikimedia in particular) ask clients to identify themselves
+USER_AGENT = "agentic-framework/0.1.0"
+
+# Marks threads belonging to the shared executor
+_worker = threading.local()
+
+# (connect, read) timeouts in seconds; never wait on a dead host indefinitely
+DEFAULT_TIMEOUT = (1.5, 5.0)
+
+# Only a failed connect is retried, once: a read that timed out is not
+# resent. Worst case per request is therefore about 1.5 + 0.2 (backoff)
+# + 1.5 + 5.0 = 8.2 s. The read timeout bounds each wait for data, not
+# the whole transfer.
+RETRY = Retry(total=1, read=0, backoff_factor=0.2)
+
+
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """
+    Create the shared HTTP session on first use.
+
+    One pooled session keeps connections (and their TLS sessions) alive
+    between requests, instead of resolving and connecting per request.
+    Responses are requested compressed with every encoding urllib3 can
+    decode here (gzip and deflate, plus br/zstd when brotli/zstandard
+    are installed). The session is closed at interpreter exit.
+
+    Returns:
+        requests.Session: Session with pooled adapters retrying per RETRY
+    """
+    session = requests.Session()
+    session.headers.update({
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'User-Agent': USER_AGENT
+    })
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=RETRY
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    atexit.register(session.close)
+    return session
+
+
+@lru_cache(maxsize=1)
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Create the thread pool that runs blocking requests for async callers.
+
+    Sized to the per-host connection pool, so every worker can hold a
+    connection.
+
+    Returns:
+        ThreadPoolExecutor: Shared executor for network requests
+    """
+    return ThreadPoolExecutor(
+        max_workers=POOL_MAXSIZE,
+        thread_name_prefix='http',
+        initializer=_mark_worker
+    )
+
+
+def _mark_worker() -> None:
+    """Flag the current thread as a get_executor() worker."""
+    _worker.active = True
+
+
+def on_executor_thread() -> bool:
+    """
+    Check whether the caller runs on a get_executor() worker.
+
+    Code on a worker must not block waiting for other work queued on the
+    same pool, or workers can end up waiting on each other.
+
+    Returns:
+        bool: True inside a task of the shared executor
+    """
+    return getattr(_worker, 'active', False)
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while a circuit breaker is open.
+
+    Example:
+        >>> raise CircuitOpenError("Wikipedia unavailable; retrying in 30s")
+    """
+    pass
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for a remote service.
+
+    After fail_max failures in a row the circuit opens and allow() refuses
+    requests for reset_timeout seconds. Then a single trial request is let
+    through: success closes the circuit, failure keeps it open for another
+    reset_timeout.
+
+    Attributes:
+        fail_max (int): Consecutive failures that open the circuit
+        reset_timeout (float): Seconds before a trial request is allowed
+    """
+
+    __slots__ = ('fail_max', 'reset_timeout', '_failures', '_opened_at', '_lock')
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        Check whether a request may be sent now.
+
+        Returns:
+            bool: False while the circuit is open
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            # Let one trial through; others keep waiting a full period
+            self._opened_at = now
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit at fail_max."""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
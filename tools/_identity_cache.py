@@ -0,0 +1,90 @@
+# agent_framework/tools/_identity_cache.py
+"""
+Bounded cache keyed by object identity.
+
+LLM instances and tool lists are not reliably hashable, so caches of
+objects built per LLM are keyed by id(). The keyed objects are stored in the
+entry and compared with `is` on lookup, so a recycled id never returns a
+value built for a different object. Entries are evicted least recently used,
+which bounds how many LLMs the cache keeps alive.
+
+Usage:
+    _TOOLS = IdentityCache(maxsize=8)
+    tools = _TOOLS.get((llm,))
+    if tools is None:
+        tools = _TOOLS.put((llm,), build_tools(llm))
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+import threading
+
+
+class IdentityCache:
+    """
+    LRU cache keyed by the identity of a tuple of objects.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept
+    """
+
+    __slots__ = ('maxsize', '_entries', '_lock')
+
+    def __init__(self, maxsize: int = 8):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple, Tuple[Tuple, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(objects: Tuple, extra: Tuple[Hashable, ...]) -> Tuple:
+        """Build the dict key from object ids and hashable extras."""
+        return tuple(map(id, objects)) + extra
+
+    def get(self, objects: Tuple, extra: Tuple[Hashable, ...] = ()) -> Optional[Any]:
+        """
+        Return the value cached for exactly these objects.
+
+        Args:
+            objects (Tuple): Objects the value was built for
+            extra (Tuple[Hashable, ...]): Additional hashable key parts
+
+        Returns:
+            Optional[Any]: Cached value, or None on a miss
+        """
+        key = self._key(objects, extra)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored = entry[0]
+            if len(stored) != len(objects) or any(a is not b for a, b in zip(stored, objects)):
+                # id reused by a different object; the stale entry goes
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, objects: Tuple, value: Any, extra: Tuple[Hashable, ...] = ()) -> Any:
+        """
+        Cache a value for these objects, evicting the least recently used.
+
+        Args:
+            objects (Tuple): Objects the value was built for
+            value (Any): Value to cache
+            extra (Tuple[Hashable, ...]): Additional hashable key parts
+
+        Returns:
+            Any: value, for chaining
+        """
+        key = self._key(objects, extra)
+        with self._lock:
+            self._entries[key] = (tuple(objects), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
@@ -1,64 +1,115 @@
 # agent_framework/tools/calculator_tool.py
 
 from langchain.tools import Tool
+from functools import lru_cache
 from typing import Optional
 import logging
 import operator
+import re
 
 logger = logging.getLogger(__name__)
 
+# Allowed operators
+_OPERATORS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv
+}
+
+# Characters kept when cleaning calculator input
+_ALLOWED_SYMBOLS = frozenset('0123456789+-*/.() ')
+
+# Translation table deleting every other ASCII character
+_DELETE_TABLE = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(128) if chr(c) not in _ALLOWED_SYMBOLS)
+)
+
+# Numbers, operators and parentheses; anything else is ignored
+_TOKEN_RE = re.compile(r'\d+(?:\.\d*)?|\.\d+|[-+*/()]')
+
+CALCULATOR_DESCRIPTION = (
+    "A calculator for basic math operations (+, -, *, /). "
+    "Input should be a simple math expression like '2 + 2' or '5 * 3'."
+)
+
+
+def safe_eval(expression: str) -> float:
+    """Safely evaluate mathematical expressions."""
+    tokens = _TOKEN_RE.findall(expression)
+    pos = 0
+
+    def peek() -> Optional[str]:
+        return tokens[pos] if pos < len(tokens) else None
+
+    def take() -> str:
+        nonlocal pos
+        if pos >= len(tokens):
+            raise ValueError("Unexpected end of expression")
+        pos += 1
+        return tokens[pos - 1]
+
+    def parse_expr() -> float:
+        # expr := term (('+' | '-') term)*
+        result = parse_term()
+        while peek() in ('+', '-'):
+            op = take()
+            result = _OPERATORS[op](result, parse_term())
+        return result
+
+    def parse_term() -> float:
+        # term := factor (('*' | '/') factor)*
+        result = parse_factor()
+        while peek() in ('*', '/'):
+            op = take()
+            result = _OPERATORS[op](result, parse_factor())
+        return result
+
+    def parse_factor() -> float:
+        # factor := ('+' | '-') factor | '(' expr ')' | number
+        token = take()
+        if token == '-':
+            return -parse_factor()
+        if token == '+':
+            return parse_factor()
+        if token == '(':
+            result = parse_expr()
+            if take() != ')':
+                raise ValueError("Missing closing parenthesis")
+            return result
+        return float(token)
+
+    try:
+        result = parse_expr()
+        if pos != len(tokens):
+            raise ValueError(f"Unexpected token: {tokens[pos]}")
+
+        # Convert to int if it's a whole number
+        if result.is_integer():
+            return int(result)
+        return result
+
+    except Exception as e:
+        logger.error(f"Calculation error: {str(e)} for input: {expression}")
+        raise ValueError(f"Invalid expression: {expression}")
+
 
 def get_calculator_tool(
         llm=None,
         custom_description: Optional[str] = None
 ) -> Tool:
-    """Create and return a simple calculator tool."""
-
-    def safe_eval(expression: str) -> float:
-        """Safely evaluate mathematical expressions."""
-        # Define allowed operators
-        operators = {
-            '+': operator.add,
-            '-': operator.sub,
-            '*': operator.mul,
-            '/': operator.truediv
-        }
+    """
+    Create and return a simple calculator tool.
 
-        try:
-            # Remove all whitespace and get tokens
-            expr = ''.join(expression.split())
-
-            # Parse for addition/subtraction first
-            terms = []
-            current_num = ''
-            current_op = '+'
-
-            for char in expr:
-                if char.isdigit() or char == '.':
-                    current_num += char
-                elif char in operators:
-                    if current_num:
-                        terms.append((float(current_num), current_op))
-                        current_num = ''
-                    current_op = char
-
-            # Add the last number
-            if current_num:
-                terms.append((float(current_num), current_op))
-
-            # Calculate result
-            result = 0
-            for num, op in terms:
-                result = operators[op](result, num)
-
-            # Convert to int if it's a whole number
-            if result.is_integer():
-                return int(result)
-            return result
+    The calculator does not use the LLM, so tools are cached by description
+    and shared between callers.
+    """
+    return _build_calculator_tool(custom_description)
 
-        except Exception as e:
-            logger.error(f"Calculation error: {str(e)} for input: {expression}")
-            raise ValueError(f"Invalid expression: {expression}")
+
+@lru_cache(maxsize=32)
+def _build_calculator_tool(custom_description: Optional[str]) -> Tool:
+    """Build the calculator Tool for a given description (cached)."""
 
     def calculator(expression: str) -> str:
         """
@@ -72,7 +123,9 @@ def get_calculator_tool(
         """
         try:
             # Extract just the numbers and operators
-            cleaned = ''.join(c for c in expression if c.isdigit() or c in '+-*/.() ')
+            cleaned = expression.translate(_DELETE_TABLE)
+            if not cleaned.isascii():
+                cleaned = cleaned.encode('ascii', 'ignore').decode('ascii')
             result = safe_eval(cleaned)
             return str(result)
         except Exception as e:
@@ -81,6 +134,6 @@ def get_calculator_tool(
     return Tool(
         name="Calculator",
         func=calculator,
-        description="A calculator for basic math operations (+, -, *, /). Input should be a simple math expression like '2 + 2' or '5 * 3'.",
+        description=custom_description or CALCULATOR_DESCRIPTION,
         return_direct=True
     )
\ No newline at end of file
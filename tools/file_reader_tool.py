@@ -36,14 +36,52 @@ Usage:
 """
 
 from langchain.tools import Tool
-from typing import Optional, Dict, List, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Optional, Dict, List, Any, NamedTuple, Tuple
+import asyncio
+import ctypes
+import errno
 import os
+import sys
+import io
 import logging
+import mmap
+import threading
+import time
 from pathlib import Path
 import json
 import yaml
 import csv
 
+# Prefer the LibYAML-backed safe loader; it is only missing when PyYAML
+# was built without LibYAML
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# orjson is optional; fall back to the stdlib json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyarrow is optional; CSV files are parsed with the csv module without it
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+# ijson is optional; large JSON files are parsed in full without it
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -58,23 +96,556 @@ SUPPORTED_FORMATS = {
     '.log': 'text'
 }
 
+# Files at least this large are read through mmap instead of read()
+MMAP_THRESHOLD = 1 << 20  # 1 MiB
+
+# JSON files larger than this are streamed instead of parsed in full
+MAX_INLINE_SIZE = 4 * 1024 * 1024  # 4 MiB
+
+# Threads used by FileReader.read_many; reads are I/O bound
+MAX_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Not every platform exposes madvise hints
+_MADV_SEQUENTIAL = getattr(mmap, 'MADV_SEQUENTIAL', None)
+
+# statx(2) flags: skip remote attribute sync, fetch only the fields used
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x0001
+_STATX_MTIME = 0x0040
+_STATX_SIZE = 0x0200
+_STATX_MASK = _STATX_TYPE | _STATX_SIZE | _STATX_MTIME
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ('tv_sec', ctypes.c_int64),
+        ('tv_nsec', ctypes.c_uint32),
+        ('_reserved', ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    """struct statx from <linux/stat.h>, padded to its full 256 bytes."""
+    _fields_ = [
+        ('stx_mask', ctypes.c_uint32),
+        ('stx_blksize', ctypes.c_uint32),
+        ('stx_attributes', ctypes.c_uint64),
+        ('stx_nlink', ctypes.c_uint32),
+        ('stx_uid', ctypes.c_uint32),
+        ('stx_gid', ctypes.c_uint32),
+        ('stx_mode', ctypes.c_uint16),
+        ('_spare0', ctypes.c_uint16),
+        ('stx_ino', ctypes.c_uint64),
+        ('stx_size', ctypes.c_uint64),
+        ('stx_blocks', ctypes.c_uint64),
+        ('stx_attributes_mask', ctypes.c_uint64),
+        ('stx_atime', _StatxTimestamp),
+        ('stx_btime', _StatxTimestamp),
+        ('stx_ctime', _StatxTimestamp),
+        ('stx_mtime', _StatxTimestamp),
+        ('_spare', ctypes.c_uint8 * 128),
+    ]
+
+
+class StatResult(NamedTuple):
+    """The stat fields FileReader uses, as returned by statx."""
+    st_mode: int
+    st_size: int
+    st_mtime: float
+
+
+@lru_cache(maxsize=1)
+def _load_statx():
+    """
+    Resolve libc's statx wrapper once.
+
+    Returns:
+        Optional[Callable]: statx function, or None where it is unavailable
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        statx = ctypes.CDLL(None, use_errno=True).statx
+    except (OSError, AttributeError):
+        return None
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                      ctypes.c_uint, ctypes.POINTER(_Statx)]
+    statx.restype = ctypes.c_int
+    return statx
+
+
+def _stat(path: str) -> Any:
+    """
+    Stat a path with a single syscall.
+
+    Uses statx(AT_STATX_DONT_SYNC) on Linux, requesting only type, size and
+    mtime, and falls back to os.stat elsewhere or when the kernel refuses.
+
+    Args:
+        path (str): Path to stat
+
+    Returns:
+        Any: StatResult or os.stat_result (both expose st_mode, st_size, st_mtime)
+
+    Raises:
+        OSError: If the path cannot be stat'ed (FileNotFoundError if missing)
+    """
+    statx = _load_statx()
+    if statx is not None:
+        buf = _Statx()
+        if statx(_AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC,
+                 _STATX_MASK, ctypes.byref(buf)) == 0:
+            mtime = buf.stx_mtime
+            return StatResult(buf.stx_mode, buf.stx_size,
+                              mtime.tv_sec + mtime.tv_nsec / 1e9)
+        err = ctypes.get_errno()
+        if err not in (errno.ENOSYS, errno.EPERM):
+            raise OSError(err, os.strerror(err), path)
+    return os.stat(path)
+
+
+# Stat results (and misses) are reused for this long, in seconds
+STAT_CACHE_TTL = 1.0
+STAT_CACHE_SIZE = 1024
+
+# Absolute path -> (expiry, stat result) and absolute path -> expiry for
+# paths that did not exist; both kept in LRU order
+_stat_cache: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+_missing_cache: 'OrderedDict[str, float]' = OrderedDict()
+_stat_lock = threading.Lock()
+
+
+def _remember(cache: OrderedDict, key: str, value: Any) -> None:
+    """Store value in an LRU cache, evicting the oldest entry when full."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > STAT_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _cached_stat(filepath: str) -> Optional[Any]:
+    """
+    Stat a file, reusing results younger than STAT_CACHE_TTL.
+
+    Args:
+        filepath (str): Path to file
+
+    Returns:
+        Optional[Any]: Stat result (see _stat), or None if the file does not exist
+    """
+    key = os.path.abspath(filepath)
+    now = time.monotonic()
+
+    with _stat_lock:
+        expiry = _missing_cache.get(key)
+        if expiry is not None:
+            if expiry > now:
+                return None
+            del _missing_cache[key]
+
+        entry = _stat_cache.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                _stat_cache.move_to_end(key)
+                return entry[1]
+            del _stat_cache[key]
+
+    try:
+        stat = _stat(key)
+    except FileNotFoundError:
+        with _stat_lock:
+            _remember(_missing_cache, key, now + STAT_CACHE_TTL)
+        return None
+
+    with _stat_lock:
+        _remember(_stat_cache, key, (now + STAT_CACHE_TTL, stat))
+    return stat
+
+
+def invalidate_stat_cache(filepath: Optional[str] = None) -> None:
+    """
+    Drop cached stat results after a file changes.
+
+    Args:
+        filepath (Optional[str]): File to forget; None clears the whole cache
+    """
+    with _stat_lock:
+        if filepath is None:
+            _stat_cache.clear()
+            _missing_cache.clear()
+            return
+        key = os.path.abspath(filepath)
+        _stat_cache.pop(key, None)
+        _missing_cache.pop(key, None)
+
+
+# Buffer size for sequential file reads
+READ_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# Open flags that are only defined on some platforms
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+_O_CLOEXEC = getattr(os, 'O_CLOEXEC', 0)
+
+
+def _open_read(filepath: str, buffering: int = READ_BUFFER_SIZE) -> Any:
+    """
+    Open a file for a single sequential binary read.
+
+    Uses O_NOATIME where permitted (only the file owner may set it) to skip
+    the access-time update, and advises the kernel that the file will be
+    read sequentially so it widens readahead.
+
+    Args:
+        filepath (str): Path to file
+        buffering (int): Buffer size; 0 returns an unbuffered io.FileIO
+
+    Returns:
+        Any: io.BufferedReader, or io.FileIO when buffering is 0
+    """
+    flags = os.O_RDONLY | _O_CLOEXEC
+    try:
+        fd = os.open(filepath, flags | _O_NOATIME)
+    except PermissionError:
+        if not _O_NOATIME:
+            raise
+        fd = os.open(filepath, flags)
+
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                # Advice is optional; some filesystems reject it
+                pass
+        return os.fdopen(fd, 'rb', buffering=buffering)
+    except BaseException:
+        os.close(fd)
+        raise
+
+
+def decode_text(data: Any) -> str:
+    """
+    Decode UTF-8 file content in one call, with universal newlines.
+
+    Equivalent to reading the file in text mode, without going through the
+    incremental TextIOWrapper decoder.
+
+    Args:
+        data (Any): bytes-like file content
+
+    Returns:
+        str: Decoded text with CRLF and CR line endings translated to LF
+    """
+    text = str(data, 'utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _read_bytes(filepath: str) -> bytes:
+    """
+    Read a whole file as bytes.
+
+    Args:
+        filepath (str): Path to file
+
+    Returns:
+        bytes: Raw file content
+    """
+    with _open_read(filepath) as f:
+        return f.read()
+
+
+# Per-thread scratch buffer reused by _parse_buffered
+_scratch = threading.local()
+
+
+def _parse_buffered(filepath: str, size: int, parse: Callable[[Any], Any]) -> Any:
+    """
+    Read a small file into this thread's scratch buffer and parse it.
+
+    The buffer is a bytearray kept per thread and grown as needed, so
+    repeated reads allocate nothing for the raw content. Only files below
+    MMAP_THRESHOLD come through here, which bounds each buffer's size.
+
+    Args:
+        filepath (str): Path to file
+        size (int): File size in bytes
+        parse (Callable[[Any], Any]): Called with a memoryview of the
+            content; must not keep a reference to it
+
+    Returns:
+        Any: Result of parse
+    """
+    # One spare byte detects files that grew since they were stat'ed
+    buf = getattr(_scratch, 'buf', None)
+    if buf is None or len(buf) <= size:
+        buf = _scratch.buf = bytearray(size + 1)
+
+    with _open_read(filepath, buffering=0) as f, memoryview(buf) as view:
+        total = 0
+        while total < len(view):
+            n = f.readinto(view[total:])
+            if not n:
+                break
+            total += n
+        if total == len(view):
+            return parse(bytes(view) + f.readall())
+        with view[:total] as content:
+            return parse(content)
+
+
+def _read_text(filepath: str, size: int) -> str:
+    """
+    Read a whole file as text.
+
+    Small files are read into a reused buffer and decoded once. Files of
+    MMAP_THRESHOLD bytes or more are memory-mapped and decoded straight from
+    the mapping, skipping the intermediate read() buffer copy.
+
+    Args:
+        filepath (str): Path to file
+        size (int): File size in bytes
+
+    Returns:
+        str: File content with universal newlines
+    """
+    if size < MMAP_THRESHOLD:
+        return _parse_buffered(filepath, size, decode_text)
+
+    with _open_read(filepath) as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if _MADV_SEQUENTIAL is not None:
+            mm.madvise(_MADV_SEQUENTIAL)
+        return decode_text(mm)
+
+
+def _load_json(filepath: str, size: int) -> Any:
+    """
+    Parse a JSON file, using orjson on the raw bytes when available.
+
+    Large files are parsed straight from a memory mapping, so no decoded
+    str copy of the document is ever built.
+
+    Args:
+        filepath (str): Path to file
+        size (int): File size in bytes
+
+    Returns:
+        Any: Parsed JSON document
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+            (orjson.JSONDecodeError is a subclass)
+    """
+    if orjson is None:
+        # json.loads detects the encoding of bytes input itself
+        return json.loads(_read_bytes(filepath))
+
+    if size < MMAP_THRESHOLD:
+        return _parse_buffered(filepath, size, orjson.loads)
+
+    with _open_read(filepath) as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if _MADV_SEQUENTIAL is not None:
+            mm.madvise(_MADV_SEQUENTIAL)
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _load_csv(filepath: str, size: int) -> Any:
+    """
+    Parse a CSV file, into a columnar pyarrow Table when pyarrow is installed.
+
+    Every column is read as a string, so cell values are the same as with
+    the csv.DictReader fallback (no "01234" -> 1234 or date inference).
+    Falls back to a list of row dicts from csv.DictReader when pyarrow is
+    missing or cannot parse the file.
+
+    Args:
+        filepath (str): Path to file
+        size (int): File size in bytes
+
+    Returns:
+        Any: pyarrow.Table or List[Dict[str, str]]
+    """
+    if pacsv is not None:
+        try:
+            with io.TextIOWrapper(_open_read(filepath), encoding='utf-8', newline='') as f:
+                header = next(csv.reader(f), [])
+            return pacsv.read_csv(filepath, convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header}
+            ))
+        except pa.ArrowInvalid as e:
+            logger.warning(f"pyarrow could not parse {filepath}, using csv module: {str(e)}")
+
+    with io.TextIOWrapper(_open_read(filepath), encoding='utf-8', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def _load_yaml(filepath: str, size: int) -> Any:
+    """
+    Parse a YAML file with the safe loader.
+
+    Args:
+        filepath (str): Path to file
+        size (int): File size in bytes
+
+    Returns:
+        Any: Parsed YAML document
+    """
+    # LibYAML decodes bytes input itself
+    return yaml.load(_read_bytes(filepath), Loader=_YamlLoader)
+
+
+# Loader for each entry in SUPPORTED_FORMATS; all take (filepath, size)
+_READERS = {
+    'json': _load_json,
+    'yaml': _load_yaml,
+    'csv': _load_csv,
+    'text': _read_text
+}
+
+
+class JSONStream(NamedTuple):
+    """
+    Handle to a JSON file too large to parse into memory at once.
+
+    read_file returns this instead of a parsed document; the content is
+    only walked, event by event, when it is written out.
+    """
+    filepath: str
+
+    def write_to(self, out: io.TextIOBase, indent: int = 2) -> None:
+        """
+        Re-serialize the document as indented JSON without building its tree.
+
+        Memory use is bounded by nesting depth rather than document size.
+
+        Args:
+            out (io.TextIOBase): Destination for the JSON text
+            indent (int): Spaces per nesting level
+        """
+        write = out.write
+        stack: List[List] = []  # [is_array, items written] per open container
+
+        with _open_read(self.filepath) as f:
+            for event, value in ijson.basic_parse(f, use_float=True):
+                if event == 'end_map' or event == 'end_array':
+                    if stack.pop()[1]:
+                        write('\n' + ' ' * (indent * len(stack)))
+                    write('}' if event == 'end_map' else ']')
+                    continue
+
+                if event == 'map_key' or (stack and stack[-1][0]):
+                    # Separator before each key or array item
+                    write(',\n' if stack[-1][1] else '\n')
+                    write(' ' * (indent * len(stack)))
+                    stack[-1][1] += 1
+                    if event == 'map_key':
+                        write(json.dumps(value) + ': ')
+                        continue
+
+                if event == 'start_map':
+                    write('{')
+                    stack.append([False, 0])
+                elif event == 'start_array':
+                    write('[')
+                    stack.append([True, 0])
+                else:
+                    write(json.dumps(value))
+
+
+def _format_result(result: Dict[str, Any]) -> str:
+    """
+    Render a read_file result as the text returned to the agent.
+
+    Args:
+        result (Dict[str, Any]): Result of FileReader.read_file
+
+    Returns:
+        str: File content or error message
+    """
+    if not result['success']:
+        return f"Error reading file: {result['error']}"
+
+    # Format content based on file type
+    content = result['content']
+    if isinstance(content, JSONStream):
+        buffer = io.StringIO()
+        content.write_to(buffer)
+        return buffer.getvalue()
+    if pa is not None and isinstance(content, pa.Table):
+        # Row records are only materialized when text is needed
+        content = content.to_pylist()
+    if isinstance(content, (dict, list)):
+        return _dump_json(content)
+    return str(content)
+
+
+def _dump_json(content: Any) -> str:
+    """
+    Serialize parsed content as indented JSON for the agent.
+
+    Args:
+        content (Any): Parsed file content (dict or list)
+
+    Returns:
+        str: JSON text indented by two spaces
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            # Types orjson cannot encode (e.g. big ints) go through json
+            pass
+    return json.dumps(content, indent=2, default=str)
+
+
+def get_file_reader_description(max_size: Optional[int] = None) -> str:
+    """
+    Build the default file reader tool description.
+
+    Args:
+        max_size (Optional[int]): Maximum file size in bytes
+
+    Returns:
+        str: Tool description
+    """
+    return (
+        "Reads content from specified files. "
+        f"Supports special handling for: {', '.join(SUPPORTED_FORMATS.keys())}. "
+        "Other file types will be read as text. "
+        f"Maximum file size: {max_size or '10MB'}"
+    )
+
 
 class FileReader:
     def __init__(self,
                  base_path: Optional[str] = None,
-                 max_size: int = 10 * 1024 * 1024):  # 10MB default
+                 max_size: int = 10 * 1024 * 1024,  # 10MB default
+                 max_inline_size: int = MAX_INLINE_SIZE):
         """
         Initialize FileReader.
 
         Args:
             base_path (Optional[str]): Base directory for file operations
             max_size (int): Maximum file size in bytes (default: 10MB)
+            max_inline_size (int): JSON files larger than this are returned as
+                a JSONStream when ijson is installed (default: 4MB)
         """
         self.base_path = base_path or os.getcwd()
         self.max_size = max_size
+        self.max_inline_size = max_inline_size
+        # Shared by every read_many call; threads start on first use
+        self._pool = ThreadPoolExecutor(max_workers=MAX_READ_WORKERS,
+                                        thread_name_prefix='file-reader')
         logger.info(f"FileReader initialized with base_path: {self.base_path}, max_size: {self.max_size}")
 
-    def validate_file(self, filepath: str) -> tuple[bool, str]:
+    def validate_file(self, filepath: str) -> tuple[bool, str, Any]:
         """
         Validate file before reading.
 
@@ -82,23 +653,24 @@ class FileReader:
             filepath (str): Path to file
 
         Returns:
-            tuple[bool, str]: (is_valid, error_message)
+            tuple[bool, str, Any]: (is_valid, error_message, stat_result);
+                stat_result is None when the file could not be stat'ed
         """
         try:
-            path = Path(filepath)
+            stat = _cached_stat(filepath)
 
             # Check if file exists
-            if not path.exists():
-                return False, f"File not found: {filepath}"
+            if stat is None:
+                return False, f"File not found: {filepath}", None
 
             # Check file size
-            if path.stat().st_size > self.max_size:
-                return False, f"File too large: {path.stat().st_size} bytes"
+            if stat.st_size > self.max_size:
+                return False, f"File too large: {stat.st_size} bytes", stat
 
-            return True, ""
+            return True, "", stat
 
         except Exception as e:
-            return False, f"Validation error: {str(e)}"
+            return False, f"Validation error: {str(e)}", None
 
     def read_file(self, filepath: str) -> Dict[str, Any]:
         """
@@ -112,41 +684,33 @@ class FileReader:
         """
         try:
             # Validate file
-            is_valid, error = self.validate_file(filepath)
+            is_valid, error, stat = self.validate_file(filepath)
             if not is_valid:
                 raise ValueError(error)
 
             path = Path(filepath)
             file_format = SUPPORTED_FORMATS.get(path.suffix, 'text')  # Default to 'text' for unsupported formats
 
-            # Read file based on format
+            # Read once, then parse based on format
+            size = stat.st_size
             try:
-                if file_format == 'json':
-                    with open(filepath, 'r') as f:
-                        content = json.load(f)
-                elif file_format == 'yaml':
-                    with open(filepath, 'r') as f:
-                        content = yaml.safe_load(f)
-                elif file_format == 'csv':
-                    with open(filepath, 'r') as f:
-                        reader = csv.DictReader(f)
-                        content = list(reader)
-                else:  # Default text reading for unsupported formats
-                    with open(filepath, 'r') as f:
-                        content = f.read()
+                if (file_format == 'json' and ijson is not None
+                        and size > self.max_inline_size):
+                    content = JSONStream(filepath)
+                else:
+                    content = _READERS[file_format](filepath, size)
             except (json.JSONDecodeError, yaml.YAMLError, csv.Error) as e:
                 # If parsing fails, fall back to text reading
                 logger.warning(f"Failed to parse {file_format} file, falling back to text reading: {str(e)}")
-                with open(filepath, 'r') as f:
-                    content = f.read()
+                content = _read_text(filepath, size)
                 file_format = 'text'
 
             # Return content with metadata
             return {
                 'content': content,
                 'format': file_format,
-                'size': path.stat().st_size,
-                'modified': path.stat().st_mtime,
+                'size': size,
+                'modified': stat.st_mtime,
                 'success': True
             }
 
@@ -158,10 +722,43 @@ class FileReader:
                 'success': False
             }
 
+    def read_many(self, filepaths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Read several files concurrently.
+
+        File reads release the GIL, so running read_file on the reader's
+        thread pool overlaps the I/O latency of independent files. The pool
+        is reused across calls, so threads are created only once.
+
+        Args:
+            filepaths (List[str]): Paths to files
+
+        Returns:
+            List[Dict[str, Any]]: read_file results, in input order
+        """
+        if len(filepaths) <= 1:
+            return [self.read_file(filepath) for filepath in filepaths]
+        return list(self._pool.map(self.read_file, filepaths))
+
+    async def aread_many(self, filepaths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Async variant of read_many that does not block the event loop.
+
+        Args:
+            filepaths (List[str]): Paths to files
+
+        Returns:
+            List[Dict[str, Any]]: read_file results, in input order
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.read_many, filepaths)
+
+
 def get_file_reader_tool(
         base_path: Optional[str] = None,
         max_size: Optional[int] = None,
-        custom_description: Optional[str] = None
+        custom_description: Optional[str] = None,
+        max_inline_size: Optional[int] = None
 ) -> Tool:
     """
     Create and return the file reader tool.
@@ -170,6 +767,7 @@ def get_file_reader_tool(
         base_path (Optional[str]): Base directory for file operations
         max_size (Optional[int]): Maximum file size in bytes
         custom_description (Optional[str]): Custom tool description
+        max_inline_size (Optional[int]): Size above which JSON files are streamed
 
     Returns:
         Tool: Configured file reader tool
@@ -177,7 +775,8 @@ def get_file_reader_tool(
     # Initialize file reader
     reader = FileReader(
         base_path=base_path,
-        max_size=max_size if max_size is not None else 10 * 1024 * 1024  # Default 10MB
+        max_size=max_size if max_size is not None else 10 * 1024 * 1024,  # Default 10MB
+        max_inline_size=max_inline_size if max_inline_size is not None else MAX_INLINE_SIZE
     )
 
     def file_reader(filepath: str) -> str:
@@ -191,87 +790,93 @@ def get_file_reader_tool(
             str: File content or error message
         """
         try:
-            result = reader.read_file(filepath)
-
-            if not result['success']:
-                return f"Error reading file: {result['error']}"
-
-            # Format content based on file type
-            content = result['content']
-            if isinstance(content, (dict, list)):
-                return json.dumps(content, indent=2)
-            return str(content)
-
+            return _format_result(reader.read_file(filepath))
         except Exception as e:
             logger.error(f"Error in file reader tool: {str(e)}")
             return f"Error reading file: {str(e)}"
 
-    # Default tool description
-    default_description = (
-        "Reads content from specified files. "
-        f"Supports special handling for: {', '.join(SUPPORTED_FORMATS.keys())}. "
-        "Other file types will be read as text. "
-        f"Maximum file size: {max_size or '10MB'}"
-    )
-
     return Tool(
         name="FileReader",
         func=file_reader,
-        description=custom_description or default_description
+        description=custom_description or get_file_reader_description(max_size)
     )
 
 
+def _parse_paths(query: str) -> List[str]:
+    """
+    Parse the batch reader input: a JSON list of paths or a single path.
 
+    Args:
+        query (str): Tool input
 
-# Optional Extensions:
+    Returns:
+        List[str]: Paths to read
+    """
+    try:
+        paths = json.loads(query)
+    except json.JSONDecodeError:
+        return [query.strip()]
+    if isinstance(paths, str):
+        return [paths]
+    return [str(path) for path in paths]
 
-# def get_advanced_file_reader_tool(
-#         base_path: Optional[str] = None,
-#         **kwargs
-# ) -> Tool:
-#     """
-#     Create advanced file reader with additional features.
-#
-#     Features:
-#     - Content summarization
-#     - Format conversion
-#     - Content filtering
-#     """
-#     reader = FileReader(base_path=base_path)
-#
-#     def advanced_reader(filepath: str, **options) -> Dict[str, Any]:
-#         """Advanced file reading with options."""
-#         result = reader.read_file(filepath)
-#
-#         if options.get('summarize'):
-#             # Add summarization logic
-#             pass
-#
-#         if options.get('format'):
-#             # Add format conversion logic
-#             pass
-#
-#         return result
-#
-#     return Tool(
-#         name="AdvancedFileReader",
-#         func=advanced_reader,
-#         description="Advanced file reader with summarization and conversion options"
-#     )
-#
-#
-# # Utility Functions
-#
-# def is_binary_file(filepath: str) -> bool:
-#     """Check if file is binary."""
-#     pass
-#
-#
-# def get_file_metadata(filepath: str) -> Dict[str, Any]:
-#     """Get detailed file metadata."""
-#     pass
-#
-#
-# def sanitize_filepath(filepath: str) -> str:
-#     """Sanitize file path for security."""
-#     pass
\ No newline at end of file
+
+def get_batch_file_reader_tool(
+        base_path: Optional[str] = None,
+        max_size: Optional[int] = None,
+        custom_description: Optional[str] = None
+) -> Tool:
+    """
+    Create a file reader tool that reads several files in one call.
+
+    The input is a JSON list of paths; files are read concurrently and the
+    output is a JSON object mapping each path to its content or error.
+    Supports both sync and async agent execution.
+
+    Args:
+        base_path (Optional[str]): Base directory for file operations
+        max_size (Optional[int]): Maximum file size in bytes
+        custom_description (Optional[str]): Custom tool description
+
+    Returns:
+        Tool: Configured multi-file reader tool
+    """
+    reader = FileReader(
+        base_path=base_path,
+        max_size=max_size if max_size is not None else 10 * 1024 * 1024  # Default 10MB
+    )
+
+    def render(paths: List[str], results: List[Dict[str, Any]]) -> str:
+        return json.dumps(
+            {path: _format_result(result) for path, result in zip(paths, results)},
+            indent=2
+        )
+
+    def batch_reader(query: str) -> str:
+        """Read every file listed in query."""
+        try:
+            paths = _parse_paths(query)
+            return render(paths, reader.read_many(paths))
+        except Exception as e:
+            logger.error(f"Error in batch file reader tool: {str(e)}")
+            return f"Error reading files: {str(e)}"
+
+    async def abatch_reader(query: str) -> str:
+        """Async variant of batch_reader."""
+        try:
+            paths = _parse_paths(query)
+            return render(paths, await reader.aread_many(paths))
+        except Exception as e:
+            logger.error(f"Error in batch file reader tool: {str(e)}")
+            return f"Error reading files: {str(e)}"
+
+    return Tool(
+        name="BatchFileReader",
+        func=batch_reader,
+        coroutine=abatch_reader,
+        description=custom_description or (
+            "Reads several files at once. Input should be a JSON list of file paths, "
+            "e.g. [\"a.txt\", \"b.json\"]. Returns a JSON object mapping each path "
+            "to its content or error."
+        )
+    )
@@ -6,19 +6,359 @@ Provides functionality for writing and modifying files with various operations.
 """
 
 from langchain.tools import BaseTool
-from pydantic import BaseModel, Field
-from typing import Dict, Any, Union, List, Optional, Literal, Type
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Callable, ClassVar, Dict, Any, Union, List, Optional, Literal, Type, Tuple
+import ctypes
+import errno
 import os
 import logging
+import mmap
+from functools import lru_cache
 from pathlib import Path
 import tempfile
-import shutil
 import re
 import json
 
+# NumPy is optional; without it newlines are located with mmap.find
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .file_reader_tool import decode_text, invalidate_stat_cache
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Files at least this large are spliced through mmap in modify_block
+MMAP_EDIT_THRESHOLD = 64 * 1024  # 64 KiB
+
+
+# Bytes scanned per vectorized step when locating lines with NumPy
+_SCAN_CHUNK = 1 << 20  # 1 MiB
+
+
+def _line_offset_scan(mm: mmap.mmap, line_count: int) -> Tuple[int, int]:
+    """
+    Find the byte offset just past the first line_count lines.
+
+    Args:
+        mm (mmap.mmap): Mapped file content
+        line_count (int): Number of lines to skip
+
+    Returns:
+        Tuple[int, int]: (byte offset, number of lines actually present);
+            the offset is the file size when the file is shorter
+    """
+    pos = 0
+    size = len(mm)
+    for found in range(line_count):
+        if pos >= size:
+            return size, found
+        newline = mm.find(b'\n', pos)
+        if newline == -1:
+            # Final line without a trailing newline
+            return size, found + 1
+        pos = newline + 1
+    return pos, line_count
+
+
+def _line_offset_numpy(mm: mmap.mmap, line_count: int) -> Tuple[int, int]:
+    """
+    Find the byte offset just past the first line_count lines with NumPy.
+
+    Newlines are counted one _SCAN_CHUNK at a time with vectorized compares,
+    and positions are only extracted for the chunk holding the target line,
+    so memory stays bounded and the scan stops early.
+
+    Args:
+        mm (mmap.mmap): Mapped file content
+        line_count (int): Number of lines to skip
+
+    Returns:
+        Tuple[int, int]: Same as _line_offset_scan
+    """
+    if line_count == 0:
+        return 0, 0
+
+    # Only plain ints are returned, so no array outlives the call and keeps
+    # the mapping exported
+    data = np.frombuffer(mm, dtype=np.uint8)
+    seen = 0
+    for start in range(0, len(data), _SCAN_CHUNK):
+        is_newline = data[start:start + _SCAN_CHUNK] == 10
+        hits = int(np.count_nonzero(is_newline))
+        if seen + hits >= line_count:
+            position = int(np.flatnonzero(is_newline)[line_count - seen - 1])
+            return start + position + 1, line_count
+        seen += hits
+
+    size = len(data)
+    # A final line without a trailing newline still counts as a line
+    if size and data[-1] != 10:
+        seen += 1
+    return size, min(line_count, seen)
+
+
+_line_offset = _line_offset_numpy if np is not None else _line_offset_scan
+
+
+def _insert_middle(existing: str, content: str) -> str:
+    """Insert content at the character midpoint of existing."""
+    mid_point = len(existing) // 2
+    return existing[:mid_point] + content + existing[mid_point:]
+
+
+# insert_text position -> function(existing, content) building the new text
+_INSERTERS = {
+    'begin': lambda existing, content: content + existing,
+    'end': lambda existing, content: existing + content,
+    'middle': _insert_middle
+}
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> 're.Pattern':
+    """
+    Compile a replace_content regex once and reuse it across calls.
+
+    Patterns are applied to one line at a time, so no flags are needed for
+    ^ and $ to anchor at line boundaries.
+
+    Args:
+        pattern (str): Regular expression
+
+    Returns:
+        re.Pattern: Compiled pattern
+    """
+    return re.compile(pattern)
+
+
+def _split_lines(text: str) -> List[str]:
+    """
+    Split text into lines the way readlines() does for universal newlines.
+
+    Args:
+        text (str): Text with LF line endings
+
+    Returns:
+        List[str]: Lines with their newline; the last one may lack it
+    """
+    parts = text.split('\n')
+    last = parts.pop()
+    lines = [part + '\n' for part in parts]
+    if last:
+        lines.append(last)
+    return lines
+
+
+def _writev_all(fd: int, buffers: List[Any]) -> None:
+    """
+    Write every buffer to fd with writev, resuming after partial writes.
+
+    Args:
+        fd (int): Open file descriptor
+        buffers (List[Any]): Bytes-like objects to write in order
+    """
+    views = [memoryview(buffer).cast('B') for buffer in buffers if len(buffer)]
+    while views:
+        written = os.writev(fd, views)
+        while views and written >= len(views[0]):
+            written -= len(views[0])
+            views.pop(0)
+        if views and written:
+            views[0] = views[0][written:]
+
+
+def _copy_fd(src_fd: int, dst_fd: int, count: int) -> None:
+    """
+    Append count bytes from the start of src_fd to dst_fd.
+
+    Uses os.sendfile so the kernel copies page cache to page cache; falls
+    back to pread/write where file-to-file sendfile is unsupported.
+
+    Args:
+        src_fd (int): Source file descriptor
+        dst_fd (int): Destination file descriptor, positioned for appending
+        count (int): Number of bytes to copy
+    """
+    offset = 0
+    if hasattr(os, 'sendfile'):
+        try:
+            while offset < count:
+                sent = os.sendfile(dst_fd, src_fd, offset, count - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except OSError as e:
+            if offset or e.errno not in (errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK):
+                raise
+
+    while offset < count:
+        chunk = os.pread(src_fd, min(count - offset, 1 << 20), offset)
+        if not chunk:
+            break
+        _writev_all(dst_fd, [chunk])
+        offset += len(chunk)
+
+
+# Linux: unnamed temp files that vanish if the writer dies before linking
+_O_TMPFILE = getattr(os, 'O_TMPFILE', 0)
+
+# linkat(2) arguments; os.link does not reliably pass AT_SYMLINK_FOLLOW
+_AT_FDCWD = -100
+_AT_SYMLINK_FOLLOW = 0x400
+
+
+@lru_cache(maxsize=1)
+def _load_linkat():
+    """
+    Resolve libc's linkat once, where O_TMPFILE files can be linked.
+
+    Returns:
+        Optional[Callable]: linkat function, or None where O_TMPFILE or
+            /proc/self/fd are unavailable
+    """
+    if not _O_TMPFILE or not os.path.isdir('/proc/self/fd'):
+        return None
+    try:
+        linkat = ctypes.CDLL(None, use_errno=True).linkat
+    except (OSError, AttributeError):
+        return None
+    linkat.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                       ctypes.c_char_p, ctypes.c_int]
+    linkat.restype = ctypes.c_int
+    return linkat
+
+
+def _link_fd(fd: int, path: str) -> None:
+    """Give the O_TMPFILE file open as fd the name path."""
+    if _load_linkat()(_AT_FDCWD, f'/proc/self/fd/{fd}'.encode(), _AT_FDCWD,
+                      os.fsencode(path), _AT_SYMLINK_FOLLOW) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), path)
+
+
+def _open_temp(directory: str) -> Tuple[int, Optional[str]]:
+    """
+    Open a temporary file for writing in directory.
+
+    Args:
+        directory (str): Directory that will hold the final file
+
+    Returns:
+        Tuple[int, Optional[str]]: File descriptor and path; the path is
+            None for an O_TMPFILE file, which has no name until linked
+    """
+    if _load_linkat() is not None:
+        try:
+            return os.open(directory, _O_TMPFILE | os.O_WRONLY | os.O_CLOEXEC, 0o600), None
+        except OSError as e:
+            # Filesystem without O_TMPFILE support; use a named file
+            if e.errno not in (errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL):
+                raise
+    return tempfile.mkstemp(dir=directory, prefix='.fw-')
+
+
+def _write_in_place(filepath: str, buffers: List[Any], source_fd: Optional[int] = None,
+                    source_size: int = 0) -> None:
+    """
+    Overwrite filepath's existing inode with buffers plus copied source bytes.
+
+    Used for hard-linked files, where replacing the directory entry would
+    split the links. Buffers may be views of the file itself, so the whole
+    new content is assembled before the file is truncated.
+
+    Args:
+        filepath (str): Existing file to overwrite
+        buffers (List[Any]): Bytes-like objects forming the new content
+        source_fd (Optional[int]): File whose first source_size bytes are
+            written after buffers
+        source_size (int): Number of bytes to copy from source_fd
+    """
+    data = bytearray().join(buffers)
+    if source_fd is not None:
+        offset = 0
+        while offset < source_size:
+            chunk = os.pread(source_fd, min(source_size - offset, 1 << 20), offset)
+            if not chunk:
+                break
+            data += chunk
+            offset += len(chunk)
+    fd = os.open(filepath, os.O_WRONLY | os.O_TRUNC | os.O_CLOEXEC)
+    try:
+        _writev_all(fd, [data])
+    finally:
+        os.close(fd)
+
+
+def _atomic_write(filepath: str, buffers: List[Any], mode: Optional[int] = None,
+                  source_fd: Optional[int] = None, source_size: int = 0) -> None:
+    """
+    Replace filepath with the concatenation of buffers, atomically.
+
+    The data goes to a temporary file in the target directory, so the final
+    os.replace is a same-filesystem rename rather than a copy. On Linux the
+    file is created with O_TMPFILE and only linked into the directory once
+    fully written, so a crash mid-write leaves nothing behind.
+
+    Symlinks are resolved first, so the link stays and its target is
+    replaced. A file with several hard links is rewritten in place instead,
+    keeping every link pointing at the new content; that write is not
+    atomic.
+
+    Args:
+        filepath (str): File to create or replace
+        buffers (List[Any]): Bytes-like objects forming the new content
+        mode (Optional[int]): Permission bits for the new file
+        source_fd (Optional[int]): File whose first source_size bytes are
+            copied after buffers
+        source_size (int): Number of bytes to copy from source_fd
+    """
+    filepath = os.path.realpath(filepath)
+    try:
+        if os.stat(filepath).st_nlink > 1:
+            _write_in_place(filepath, buffers, source_fd, source_size)
+            return
+    except FileNotFoundError:
+        pass
+
+    directory = os.path.dirname(filepath)
+    fd, temp_path = _open_temp(directory)
+    try:
+        try:
+            _writev_all(fd, buffers)
+            if source_fd is not None:
+                _copy_fd(source_fd, fd, source_size)
+            if mode is not None:
+                os.fchmod(fd, mode)
+            if temp_path is None:
+                # linkat cannot overwrite, so name it and rename over the target
+                temp_path = os.path.join(directory, f'.fw-{os.urandom(6).hex()}')
+                _link_fd(fd, temp_path)
+        finally:
+            os.close(fd)
+        os.replace(temp_path, filepath)
+    except BaseException:
+        if temp_path is not None:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+        raise
+
+
+FILE_WRITER_DESCRIPTION = """Write or modify files with various operations (input should be a JSON string):
+    1. modify_block: Replace content between specific lines
+    2. insert: Add text at beginning, middle, or end
+    3. replace: Replace content using plain text or regex patterns (regex matches never span lines)
+
+    Examples:
+    For insertion: {"operation": "insert", "target_file": "file.txt", "insert_position": "end", "insert_string": "new text"}
+    For block modification: {"operation": "modify_block", "target_file": "file.txt", "start_line": 1, "end_line": 5, "insert_string": "new content"}
+    For replacement: {"operation": "replace", "target_file": "file.txt", "pattern": "old", "replacement": "new", "use_regex": false}"""
+
 
 class FileWriterInput(BaseModel):
     """Schema for FileWriter input"""
@@ -69,15 +409,26 @@ class FileWriter:
             if not is_valid:
                 raise ValueError(error)
 
-            # Create file if it doesn't exist
+            # Large files: splice the block in without materializing lines
+            if (start_line >= 1 and start_line <= end_line
+                    and os.path.exists(filepath)
+                    and os.path.getsize(filepath) >= MMAP_EDIT_THRESHOLD):
+                self._splice_block(filepath, start_line, end_line, content)
+                invalidate_stat_cache(filepath)
+                return {
+                    'success': True,
+                    'message': f"Modified lines {start_line}-{end_line}"
+                }
+
+            # New files start as empty lines up to the block
+            mode = None
             if not os.path.exists(filepath):
-                with open(filepath, 'w') as f:
-                    f.write('\n' * (start_line - 1))
-                lines = [''] * (start_line - 1)
+                lines = ['\n'] * (start_line - 1)
             else:
                 # Read existing content
-                with open(filepath, 'r') as f:
-                    lines = f.readlines()
+                with open(filepath, 'rb') as f:
+                    lines = _split_lines(decode_text(f.read()))
+                    mode = os.fstat(f.fileno()).st_mode & 0o7777
 
             # Validate line numbers
             if start_line < 1:
@@ -87,17 +438,20 @@ class FileWriter:
             while len(lines) < end_line:
                 lines.append('\n')
 
-            # Prepare new content
-            new_content = content.split('\n')
-            if not new_content[-1].endswith('\n'):
-                new_content[-1] += '\n'
+            # Prepare new content; the block always ends with a newline
+            new_content = content if content.endswith('\n') else content + '\n'
 
             # Replace block
-            lines[start_line - 1:end_line] = new_content
+            lines[start_line - 1:end_line] = [new_content]
 
-            # Write back to file
-            with open(filepath, 'w') as f:
-                f.writelines(lines)
+            # Write back in one write: atomically over an existing file
+            data = ''.join(lines).encode()
+            if mode is not None:
+                _atomic_write(filepath, [data], mode)
+            else:
+                with open(filepath, 'wb') as f:
+                    f.write(data)
+            invalidate_stat_cache(filepath)
 
             return {
                 'success': True,
@@ -111,6 +465,34 @@ class FileWriter:
                 'error': str(e)
             }
 
+    def _splice_block(self, filepath: str, start_line: int, end_line: int, content: str) -> None:
+        """
+        Replace lines start_line..end_line of a large file via mmap.
+
+        The line boundaries are located with an index scan over the mapping,
+        and the head, new block and tail are written with one writev into a
+        temporary file that atomically replaces the original.
+
+        Args:
+            filepath (str): Existing file to modify
+            start_line (int): First line to replace (1-based)
+            end_line (int): Last line to replace (inclusive, >= start_line)
+            content (str): Replacement text
+        """
+        block = (content if content.endswith('\n') else content + '\n').encode()
+        with open(filepath, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            head_end, found = _line_offset(mm, start_line - 1)
+            tail_start, _ = _line_offset(mm, end_line)
+            # Pad with empty lines when editing past the end of the file
+            padding = b'\n' * (start_line - 1 - found)
+            with memoryview(mm) as view:
+                _atomic_write(
+                    filepath,
+                    [view[:head_end], padding, block, view[tail_start:]],
+                    os.fstat(f.fileno()).st_mode & 0o7777
+                )
+
     def insert_text(self, filepath: str, position: str, content: str) -> Dict[str, Any]:
         """Insert text at specified position."""
         try:
@@ -118,25 +500,34 @@ class FileWriter:
             if not is_valid:
                 raise ValueError(error)
 
-            # Create file if it doesn't exist
-            if not os.path.exists(filepath):
-                existing_content = ""
+            if position == 'end':
+                # Append in place; existing content is never read or rewritten
+                with open(filepath, 'ab') as f:
+                    f.write(content.encode('utf-8'))
+            elif position == 'begin' and os.path.exists(filepath):
+                # Write the prefix, then let the kernel copy the old content;
+                # _atomic_write resolves symlinks, so a link keeps pointing
+                # at the (updated) target
+                with open(filepath, 'rb') as f:
+                    stat = os.fstat(f.fileno())
+                    _atomic_write(filepath, [content.encode('utf-8')],
+                                  stat.st_mode & 0o7777, f.fileno(), stat.st_size)
             else:
-                with open(filepath, 'r') as f:
-                    existing_content = f.read()
-
-            if position == 'begin':
-                new_content = content + existing_content
-            elif position == 'end':
-                new_content = existing_content + content
-            elif position == 'middle':
-                mid_point = len(existing_content) // 2
-                new_content = existing_content[:mid_point] + content + existing_content[mid_point:]
-            else:
-                raise ValueError(f"Invalid position: {position}")
-
-            with open(filepath, 'w') as f:
-                f.write(new_content)
+                # Create file if it doesn't exist
+                if not os.path.exists(filepath):
+                    existing_content = ""
+                else:
+                    with open(filepath, 'rb') as f:
+                        existing_content = decode_text(f.read())
+
+                try:
+                    new_content = _INSERTERS[position](existing_content, content)
+                except KeyError:
+                    raise ValueError(f"Invalid position: {position}") from None
+
+                with open(filepath, 'wb') as f:
+                    f.write(new_content.encode('utf-8'))
+            invalidate_stat_cache(filepath)
 
             return {
                 'success': True,
@@ -152,7 +543,15 @@ class FileWriter:
 
     def replace_content(self, filepath: str, pattern: str, replacement: str,
                         use_regex: bool = False) -> Dict[str, Any]:
-        """Replace content using sed-like operations."""
+        """
+        Replace content using sed-like operations.
+
+        Plain patterns are replaced in one bytes.replace pass. Regex patterns
+        are applied line by line, as sed does: a match never spans a line
+        break, so patterns like \s+ or [^x]+ cannot merge lines. The result
+        is written in one go and atomically swapped in; when nothing
+        matches, the file is not rewritten at all.
+        """
         try:
             is_valid, error = self.validate_file(filepath)
             if not is_valid:
@@ -164,26 +563,38 @@ class FileWriter:
                     'error': "File does not exist and cannot be created for replacement operation"
                 }
 
-            # Create temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, mode='w')
-            replacements = 0
-
-            with open(filepath, 'r') as f:
-                for line in f:
-                    if use_regex:
-                        new_line, count = re.subn(pattern, replacement, line)
-                    else:
-                        new_line = line.replace(pattern, replacement)
-                        count = (len(line) - len(new_line)) // (len(pattern) - len(replacement)) \
-                            if len(pattern) != len(replacement) else 0
-
+            # Compile first so a bad pattern fails before any I/O
+            pattern_re = _compile(pattern) if use_regex else None
+
+            with open(filepath, 'rb') as f:
+                data = f.read()
+                mode = os.fstat(f.fileno()).st_mode & 0o7777
+
+            if pattern_re is not None:
+                text = data.decode('utf-8')
+                if pattern_re.search(text) is None:
+                    return self._no_replacements()
+                new_lines = []
+                replacements = 0
+                subn = pattern_re.subn
+                for line in _split_lines(text):
+                    new_line, count = subn(replacement, line)
+                    new_lines.append(new_line)
                     replacements += count
-                    temp_file.write(new_line)
-
-            temp_file.close()
+                if not replacements:
+                    return self._no_replacements()
+                new_data = ''.join(new_lines).encode('utf-8')
+            else:
+                # UTF-8 is self-synchronizing, so byte-level matches are exact
+                pattern_bytes = pattern.encode('utf-8')
+                replacements = data.count(pattern_bytes)
+                if not replacements:
+                    return self._no_replacements()
+                new_data = data.replace(pattern_bytes, replacement.encode('utf-8'))
 
             # Replace original file
-            shutil.move(temp_file.name, filepath)
+            _atomic_write(filepath, [new_data], mode)
+            invalidate_stat_cache(filepath)
 
             return {
                 'success': True,
@@ -192,31 +603,36 @@ class FileWriter:
 
         except Exception as e:
             logger.error(f"Error replacing content: {str(e)}")
-            if 'temp_file' in locals():
-                os.unlink(temp_file.name)
             return {
                 'success': False,
                 'error': str(e)
             }
 
 
+    @staticmethod
+    def _no_replacements() -> Dict[str, Any]:
+        """Result for a pattern that does not occur; the file is left untouched."""
+        return {
+            'success': True,
+            'message': "Made 0 replacements"
+        }
+
+
 class FileWriterTool(BaseTool):
     """Tool for writing and modifying files."""
     name: str = "FileWriter"
-    description: str = """Write or modify files with various operations (input should be a JSON string):
-    1. modify_block: Replace content between specific lines
-    2. insert: Add text at beginning, middle, or end
-    3. replace: Replace content using plain text or regex patterns
-
-    Examples:
-    For insertion: {"operation": "insert", "target_file": "file.txt", "insert_position": "end", "insert_string": "new text"}
-    For block modification: {"operation": "modify_block", "target_file": "file.txt", "start_line": 1, "end_line": 5, "insert_string": "new content"}
-    For replacement: {"operation": "replace", "target_file": "file.txt", "pattern": "old", "replacement": "new", "use_regex": false}"""
+    description: str = FILE_WRITER_DESCRIPTION
 
     return_direct: bool = False
     base_path: Optional[str] = Field(default=None, description="Base path for file operations")
     file_writer: Optional[FileWriter] = Field(default=None, exclude=True)
 
+    # operation -> bound handler, built once per instance
+    _handlers: Dict[str, Callable[[str, Dict[str, Any]], Any]] = PrivateAttr(default_factory=dict)
+
+    # Shared decoder; saves json.loads' per-call argument handling
+    _decode: ClassVar[Callable[[str], Any]] = json.JSONDecoder().decode
+
     class Config:
         """Pydantic config"""
         arbitrary_types_allowed = True
@@ -226,13 +642,48 @@ class FileWriterTool(BaseTool):
         """Initialize the tool with base path."""
         super().__init__(**data)
         self.file_writer = FileWriter(self.base_path or os.getcwd())
+        self._handlers = {
+            'insert': self._insert,
+            'modify_block': self._modify_block,
+            'replace': self._replace
+        }
+
+    def _insert(self, target_file: str, kwargs: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
+        """Handle the 'insert' operation."""
+        return self.file_writer.insert_text(
+            target_file,
+            kwargs.get('insert_position', 'end'),
+            kwargs.get('insert_string', '')
+        )
+
+    def _modify_block(self, target_file: str, kwargs: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
+        """Handle the 'modify_block' operation."""
+        if not all([kwargs.get('start_line'), kwargs.get('end_line'), kwargs.get('insert_string')]):
+            return "Error: modify_block requires start_line, end_line, and insert_string"
+        return self.file_writer.modify_block(
+            target_file,
+            kwargs.get('start_line'),
+            kwargs.get('end_line'),
+            kwargs.get('insert_string')
+        )
+
+    def _replace(self, target_file: str, kwargs: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
+        """Handle the 'replace' operation."""
+        if not all([kwargs.get('pattern'), kwargs.get('replacement')]):
+            return "Error: replace requires pattern and replacement"
+        return self.file_writer.replace_content(
+            target_file,
+            kwargs.get('pattern'),
+            kwargs.get('replacement'),
+            kwargs.get('use_regex', False)
+        )
 
     def _run(self, input_str: str) -> str:
         """Execute the file writing operation."""
         try:
             # Parse the input JSON string
             try:
-                kwargs = json.loads(input_str)
+                kwargs = self._decode(input_str)
             except json.JSONDecodeError:
                 return "Error: Input must be a valid JSON string"
 
@@ -242,33 +693,14 @@ class FileWriterTool(BaseTool):
             if not operation or not target_file:
                 return "Error: Missing operation or target_file"
 
-            if operation == 'insert':
-                result = self.file_writer.insert_text(
-                    target_file,
-                    kwargs.get('insert_position', 'end'),
-                    kwargs.get('insert_string', '')
-                )
-            elif operation == 'modify_block':
-                if not all([kwargs.get('start_line'), kwargs.get('end_line'), kwargs.get('insert_string')]):
-                    return "Error: modify_block requires start_line, end_line, and insert_string"
-                result = self.file_writer.modify_block(
-                    target_file,
-                    kwargs.get('start_line'),
-                    kwargs.get('end_line'),
-                    kwargs.get('insert_string')
-                )
-            elif operation == 'replace':
-                if not all([kwargs.get('pattern'), kwargs.get('replacement')]):
-                    return "Error: replace requires pattern and replacement"
-                result = self.file_writer.replace_content(
-                    target_file,
-                    kwargs.get('pattern'),
-                    kwargs.get('replacement'),
-                    kwargs.get('use_regex', False)
-                )
-            else:
+            handler = self._handlers.get(operation)
+            if handler is None:
                 return f"Error: Unknown operation '{operation}'"
 
+            # Handlers return an error string for invalid arguments
+            result = handler(target_file, kwargs)
+            if isinstance(result, str):
+                return result
             return result['message'] if result['success'] else f"Error: {result['error']}"
 
         except Exception as e:
@@ -280,9 +712,6 @@ class FileWriterTool(BaseTool):
         raise NotImplementedError("Async version not implemented")
 
 
-
-
-
 def get_file_writer_tool(base_path: str = None) -> BaseTool:
     """Create and return the file writer tool."""
-    return FileWriterTool(base_path=base_path)
\ No newline at end of file
+    return FileWriterTool(base_path=base_path)
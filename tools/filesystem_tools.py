@@ -89,7 +89,7 @@ ENV: Determines security mode
 
 Dependencies:
 -----------
-- langchain_community.tools
+- langchain_community.tools (imported on first use)
 - config.settings (for environment configuration)
 - pathlib (for path operations)
 - logging (for operation logging)
@@ -102,22 +102,152 @@ See Also:
 """
 
 
-from langchain_community.tools import (
-    ReadFileTool,
-    WriteFileTool,
-    ListDirectoryTool,
-    FileSearchTool,
-)
 from langchain.tools import Tool
+from pydantic import PrivateAttr
 import logging
 import os
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import re
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 from config.settings import FILESYSTEM_CONFIG, ENVIRONMENT
 
 logger = logging.getLogger(__name__)
 
 
+def _snapshot_config() -> Tuple[Optional[int], bool, Optional[str], frozenset]:
+    """
+    Read the FILESYSTEM_CONFIG values used on the tool paths.
+
+    Returns:
+        Tuple[Optional[int], bool, Optional[str], frozenset]: max_file_size,
+            enable_security, root_dir and allowed_operations
+    """
+    return (
+        FILESYSTEM_CONFIG.get('max_file_size'),
+        bool(FILESYSTEM_CONFIG.get('security', {}).get('enable_security', False)),
+        FILESYSTEM_CONFIG.get('root_dir'),
+        frozenset(FILESYSTEM_CONFIG.get('allowed_operations') or ())
+    )
+
+
+# Configuration is read-only at runtime, so it is read once; see _reload_config
+_MAX_FILE_SIZE, _SECURITY_ENABLED, _DEFAULT_ROOT, _DEFAULT_OPS = _snapshot_config()
+
+# Tool classes exported lazily; langchain_community is slow to import
+_LAZY_TOOL_NAMES = frozenset(('ReadFileTool', 'WriteFileTool', 'ListDirectoryTool', 'FileSearchTool'))
+
+
+@lru_cache(maxsize=1)
+def _file_tool_classes() -> Dict[str, type]:
+    """
+    Import the langchain_community filesystem tools on first use.
+
+    Returns:
+        Dict[str, type]: Operation name -> tool class, in a stable order
+    """
+    from langchain_community.tools import (
+        ReadFileTool,
+        WriteFileTool,
+        ListDirectoryTool,
+        FileSearchTool,
+    )
+    return {
+        'read': ReadFileTool,
+        'write': WriteFileTool,
+        'list': ListDirectoryTool,
+        'search': FileSearchTool
+    }
+
+
+@lru_cache(maxsize=1)
+def _tool_op_names() -> Dict[type, str]:
+    """
+    Map each filesystem tool class to its operation name.
+
+    Returns:
+        Dict[type, str]: Inverse of _file_tool_classes
+    """
+    return {tool_class: op for op, tool_class in _file_tool_classes().items()}
+
+
+def __getattr__(name):
+    """Resolve the langchain_community tool classes lazily (PEP 562)."""
+    if name not in _LAZY_TOOL_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    for tool_class in _file_tool_classes().values():
+        globals()[tool_class.__name__] = tool_class
+    return globals()[name]
+
+
+def _compile_patterns(patterns: Iterable[str]) -> Optional[re.Pattern]:
+    """
+    Compile literal path patterns into one alternation matcher.
+
+    A single search over the path replaces one substring scan per pattern.
+
+    Args:
+        patterns (Iterable[str]): Substrings to look for
+
+    Returns:
+        Optional[re.Pattern]: Matcher, or None when there are no patterns
+    """
+    patterns = tuple(patterns or ())
+    if not patterns:
+        return None
+    return re.compile('|'.join(map(re.escape, patterns)))
+
+
+# Relative paths resolve against the working directory, which this package
+# never changes; call _abspath.cache_clear() after any os.chdir
+@lru_cache(maxsize=4096)
+def _abspath(path: str) -> str:
+    """Cached os.path.abspath."""
+    return os.path.abspath(path)
+
+
+@lru_cache(maxsize=32)
+def _root_prefix(root_dir: str) -> str:
+    """
+    Return the absolute root directory with exactly one trailing separator.
+
+    A path is inside the root if it starts with this prefix or equals it
+    without the separator; the separator keeps '/safe2' from passing as
+    inside '/safe'.
+
+    Args:
+        root_dir (str): Root directory
+
+    Returns:
+        str: Absolute root path ending in os.sep
+    """
+    return _abspath(root_dir).rstrip(os.sep) + os.sep
+
+
+def _extension(path: str) -> str:
+    """
+    Return the lowercased extension of a path, like os.path.splitext.
+
+    Args:
+        path (str): File path
+
+    Returns:
+        str: Extension including the dot, or '' if there is none
+    """
+    dot = path.rfind('.')
+    sep = path.rfind(os.sep)
+    # Dots in directory names and leading dots of hidden files don't count
+    if dot <= sep + 1 or not path[sep + 1:dot].strip('.'):
+        return ''
+    return path[dot:].lower()
+
+
+# Characters rejected by the module-level validate_path, as a deletion
+# table: a path is suspicious if translating it changes its length
+_SUSPICIOUS_CHARS = str.maketrans('', '', '~$|;&')
+
+
 class FileSystemSecurity:
     """
     Security manager for filesystem operations.
@@ -130,15 +260,32 @@ class FileSystemSecurity:
         security_config (dict): Specific security rules and settings
         metrics (FileSystemMetrics): Optional metrics tracking instance
 
+    The security settings are read once at construction; changing
+    security_config afterwards has no effect.
+
     Example:
         >>> security = FileSystemSecurity(config={'security': {'validate_paths': True}})
         >>> security.validate_path('/safe/path/file.txt', '/safe/path')
     """
 
+    __slots__ = ('config', 'security_config', 'metrics', '_validate_paths',
+                 '_log_all', '_restricted_prefixes', '_restricted_re',
+                 '_allowed_ext')
+
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or FILESYSTEM_CONFIG
-        self.security_config = self.config.get('security', {})
-        self.metrics = FileSystemMetrics() if self.security_config.get('monitor_operations') else None
+        self.security_config = sc = self.config.get('security', {})
+        self.metrics = (FileSystemMetrics(sc.get('error_buffer_size', ERROR_BUFFER_SIZE))
+                        if sc.get('monitor_operations') else None)
+        # Flattened once; reconfiguring means constructing a new instance
+        self._validate_paths = bool(sc.get('validate_paths', True))
+        self._log_all = bool(sc.get('log_all_operations'))
+        # Absolute patterns are root prefixes; the rest match anywhere
+        restricted = tuple(sc.get('restricted_patterns') or ())
+        self._restricted_prefixes = tuple(p for p in restricted if p.startswith(os.sep))
+        self._restricted_re = _compile_patterns(p for p in restricted if not p.startswith(os.sep))
+        extensions = sc.get('allowed_extensions')
+        self._allowed_ext = frozenset(e.lower() for e in extensions) if extensions else None
 
     def validate_path(self, path: str, root_dir: str) -> bool:
         """
@@ -160,36 +307,36 @@ class FileSystemSecurity:
             >>> validate_path('/etc/passwd', '/data')
             False
         """
-        if not self.security_config.get('validate_paths', True):
+        if not self._validate_paths:
             return True
 
         try:
             # Convert to absolute paths
-            abs_path = os.path.abspath(path)
-            abs_root = os.path.abspath(root_dir)
+            abs_path = _abspath(path)
+            root_prefix = _root_prefix(root_dir)
 
             # Check if path is within root directory
-            if not abs_path.startswith(abs_root):
-                logger.warning(f"Path {path} is outside root directory {root_dir}")
+            if not (abs_path.startswith(root_prefix) or abs_path == root_prefix[:-1]):
+                logger.warning("Path %s is outside root directory %s", path, root_dir)
                 return False
 
             # Check for restricted patterns
-            restricted_patterns = self.security_config.get('restricted_patterns', [])
-            if any(pattern in path for pattern in restricted_patterns):
-                logger.warning(f"Path {path} contains restricted patterns")
+            if (abs_path.startswith(self._restricted_prefixes)
+                    or self._restricted_re is not None and self._restricted_re.search(path)):
+                logger.warning("Path %s contains restricted patterns", path)
                 return False
 
             # Check file extension if specified
-            if self.security_config.get('allowed_extensions'):
-                file_ext = os.path.splitext(path)[1].lower()
-                if file_ext not in self.security_config['allowed_extensions']:
-                    logger.warning(f"File extension {file_ext} is not allowed")
+            if self._allowed_ext is not None:
+                file_ext = _extension(path)
+                if file_ext not in self._allowed_ext:
+                    logger.warning("File extension %s is not allowed", file_ext)
                     return False
 
             return True
 
         except Exception as e:
-            logger.error(f"Path validation error: {str(e)}")
+            logger.error("Path validation error: %s", e)
             return False
 
     def log_operation(self, operation: str, path: str):
@@ -205,13 +352,57 @@ class FileSystemSecurity:
         Example:
             >>> security.log_operation('read', '/data/file.txt')
         """
-        if self.security_config.get('log_all_operations'):
-            logger.info(f"Filesystem operation: {operation} on {path}")
+        if self._log_all:
+            logger.info("Filesystem operation: %s on %s", operation, path)
 
         if self.metrics:
             self.metrics.record_operation(operation)
 
 
+class _NullFileSystemSecurity:
+    """
+    Security manager for configurations with security disabled.
+
+    Allows every path and logs nothing; create_safe_file_tool returns
+    unwrapped tools for it.
+    """
+
+    __slots__ = ()
+
+    metrics = None
+
+    @staticmethod
+    def validate_path(path: str, root_dir: str) -> bool:
+        """Accept any path."""
+        return True
+
+    @staticmethod
+    def log_operation(operation: str, path: str):
+        """Do nothing."""
+        return None
+
+
+def get_security_manager(config: Dict[str, Any] = None):
+    """
+    Return the security manager matching a filesystem configuration.
+
+    Args:
+        config (Dict[str, Any]): Filesystem configuration (default:
+            FILESYSTEM_CONFIG)
+
+    Returns:
+        FileSystemSecurity, or a no-op manager when
+        security.enable_security is off
+    """
+    if config is None:
+        enabled = _SECURITY_ENABLED
+    else:
+        enabled = config.get('security', {}).get('enable_security', False)
+    if not enabled:
+        return _NullFileSystemSecurity()
+    return FileSystemSecurity(config)
+
+
 def validate_path(path: str, root_dir: str) -> bool:
     """
     Validate file path for security.
@@ -234,27 +425,117 @@ def validate_path(path: str, root_dir: str) -> bool:
     """
     try:
         # Convert to absolute paths
-        abs_path = os.path.abspath(path)
-        abs_root = os.path.abspath(root_dir)
+        abs_path = _abspath(path)
+        root_prefix = _root_prefix(root_dir)
 
         # Check if path is within root directory
-        if not abs_path.startswith(abs_root):
-            logger.warning(f"Path {path} is outside root directory {root_dir}")
+        if not (abs_path.startswith(root_prefix) or abs_path == root_prefix[:-1]):
+            logger.warning("Path %s is outside root directory %s", path, root_dir)
             return False
 
-        # Check for suspicious patterns
-        suspicious_patterns = ['..', '~', '\$', '|', ';', '&']
-        if any(pattern in path for pattern in suspicious_patterns):
-            logger.warning(f"Path {path} contains suspicious patterns")
+        # Check for suspicious patterns: '..' and shell metacharacters
+        if '..' in path or len(path.translate(_SUSPICIOUS_CHARS)) != len(path):
+            logger.warning("Path %s contains suspicious patterns", path)
             return False
 
         return True
 
     except Exception as e:
-        logger.error(f"Path validation error: {str(e)}")
+        logger.error("Path validation error: %s", e)
         return False
 
 
+# Tool class -> its security-checked subclass, built on first use
+_SAFE_SUBCLASSES: Dict[type, type] = {}
+
+
+def _make_safe_call(tool_class, max_size: Optional[int], check_size: bool, op_name: str):
+    """
+    Build the security-checked __call__ for a tool class.
+
+    Per-class constants are bound as keyword defaults, so each call reads
+    them as locals instead of recomputing them or looking them up in
+    FILESYSTEM_CONFIG.
+
+    Args:
+        tool_class: Tool class whose __call__ is wrapped
+        max_size (Optional[int]): Size limit for reads; None disables it
+        check_size (bool): Whether calls read files and need the size check
+        op_name (str): Operation name passed to log_operation
+
+    Returns:
+        Callable: Replacement __call__
+    """
+    original_call = tool_class.__call__
+
+    def __call__(self, *args, _max=max_size, _check_size=check_size, _op=op_name, **kwargs):
+        """Add security checks to tool execution."""
+        try:
+            # Get file path from args or kwargs
+            file_path = args[0] if args else kwargs.get('file_path')
+
+            if not file_path:
+                raise ValueError("No file path provided")
+
+            # Validate path using security manager
+            security_manager = self._security_manager
+            if not security_manager.validate_path(file_path, self.root_dir):
+                raise SecurityError(f"Invalid or unsafe path: {file_path}")
+
+            # Check file size for read operations
+            if _check_size and _max is not None:
+                # One stat; a missing file is left for the tool to report
+                try:
+                    size = os.stat(os.path.join(self.root_dir, file_path)).st_size
+                except FileNotFoundError:
+                    size = None
+                if size is not None and size > _max:
+                    raise ResourceError(f"File exceeds size limit: {file_path}")
+
+        except (FileSystemError, ValueError) as e:
+            logger.warning("Blocked %s operation: %s", _op, e)
+            return f"Error: {e}"
+
+        # Log operation
+        security_manager.log_operation(_op, file_path)
+
+        # Execute original function; its own errors propagate to the caller
+        return original_call(self, *args, **kwargs)
+
+    return __call__
+
+
+def _safe_subclass(tool_class) -> type:
+    """
+    Return the security-checked subclass of a tool class, creating it once.
+
+    Args:
+        tool_class: Tool class to specialize
+
+    Returns:
+        type: Subclass whose __call__ validates paths before delegating
+    """
+    safe_class = _SAFE_SUBCLASSES.get(tool_class)
+    if safe_class is None:
+        # Standard tools log as read/write/list/search, matching the
+        # FileSystemMetrics counters; other classes fall back to their name
+        op_name = _tool_op_names().get(tool_class)
+        if op_name is None:
+            op_name = tool_class.__name__.replace('Tool', '').lower()
+        safe_class = type(f"Safe{tool_class.__name__}", (tool_class,), {
+            '__module__': __name__,
+            '__call__': _make_safe_call(
+                tool_class,
+                max_size=_MAX_FILE_SIZE,
+                check_size=issubclass(tool_class, _file_tool_classes()['read']),
+                op_name=op_name
+            ),
+            '_security_manager': PrivateAttr(default=None)
+        })
+        _SAFE_SUBCLASSES[tool_class] = safe_class
+    return safe_class
+
+
 def create_safe_file_tool(
         tool_class,
         root_dir: str,
@@ -265,12 +546,14 @@ def create_safe_file_tool(
     Create a filesystem tool with appropriate security wrapper based on environment.
 
     Wraps standard filesystem tools with security checks and logging capabilities.
-    In development mode, minimal wrapping is applied for maximum flexibility.
+    The checks live in a subclass generated once per tool class, so creating
+    a tool no longer builds a closure per instance.
 
     Args:
         tool_class: The tool class to instantiate (ReadFileTool, WriteFileTool, etc.)
         root_dir (str): Base directory for file operations
-        security_manager (FileSystemSecurity): Security manager instance
+        security_manager (FileSystemSecurity): Security manager instance; the
+            no-op manager from get_security_manager skips the wrapper
         **kwargs: Additional arguments for tool initialization
 
     Returns:
@@ -280,58 +563,67 @@ def create_safe_file_tool(
         Exception: If tool creation fails
 
     Example:
-        >>> security_manager = FileSystemSecurity()
+        >>> security_manager = get_security_manager()
         >>> read_tool = create_safe_file_tool(ReadFileTool, '/data', security_manager)
     """
     try:
         # Create root directory if it doesn't exist
         os.makedirs(root_dir, exist_ok=True)
 
-        # Create the base tool
-        base_tool = tool_class(root_dir=root_dir, **kwargs)
+        # Nothing to check when security is disabled
+        if isinstance(security_manager, _NullFileSystemSecurity):
+            return tool_class(root_dir=root_dir, **kwargs)
 
-        # Get the original call method
-        original_call = base_tool.__call__
+        tool = _safe_subclass(tool_class)(root_dir=root_dir, **kwargs)
+        tool._security_manager = security_manager
+        return tool
 
-        # Create safe wrapper
-        def safe_wrapper(*args, **kwargs):
-            """Add security checks to tool execution."""
-            try:
-                # Get file path from args or kwargs
-                file_path = args[0] if args else kwargs.get('file_path')
+    except Exception as e:
+        logger.error("Tool creation error: %s", e)
+        raise
 
-                if not file_path:
-                    raise ValueError("No file path provided")
 
-                # Validate path using security manager
-                if not security_manager.validate_path(file_path, root_dir):
-                    raise SecurityError(f"Invalid or unsafe path: {file_path}")
+# Roots already created by this process
+_CREATED_ROOTS = set()
 
-                # Check file size for read operations
-                if isinstance(base_tool, ReadFileTool):
-                    full_path = os.path.join(root_dir, file_path)
-                    if os.path.exists(full_path):
-                        if os.path.getsize(full_path) > FILESYSTEM_CONFIG['max_file_size']:
-                            raise ResourceError(f"File exceeds size limit: {file_path}")
 
-                # Log operation
-                operation_type = tool_class.__name__.replace('Tool', '').lower()
-                security_manager.log_operation(operation_type, file_path)
+def _ensure_root(root_dir: str) -> None:
+    """Create root_dir if needed, at most once per process and directory."""
+    if root_dir not in _CREATED_ROOTS:
+        os.makedirs(root_dir, exist_ok=True)
+        _CREATED_ROOTS.add(root_dir)
 
-                # Execute original function
-                return original_call(*args, **kwargs)
 
-            except Exception as e:
-                logger.error(f"Tool execution error: {str(e)}")
-                return f"Error: {str(e)}"
+@lru_cache(maxsize=1)
+def _unrestricted_tools() -> tuple:
+    """Build the filesystem tools used when security is disabled (cached)."""
+    # When security is disabled, create tools with no root_dir restriction
+    tools = tuple(tool_class() for tool_class in _file_tool_classes().values())
+    logger.info("Initialized %d filesystem tools with no restrictions", len(tools))
+    return tools
 
-        # Replace original __call__ with safe wrapper
-        base_tool.__call__ = safe_wrapper
-        return base_tool
 
-    except Exception as e:
-        logger.error(f"Tool creation error: {str(e)}")
-        raise
+@lru_cache(maxsize=16)
+def _restricted_tools(root_dir: str, allowed_operations: frozenset) -> tuple:
+    """
+    Build the filesystem tools for a root and set of operations (cached).
+
+    Args:
+        root_dir (str): Root directory for file operations
+        allowed_operations (frozenset): Allowed operation names
+
+    Returns:
+        tuple: Tools, in _file_tool_classes order
+    """
+    # Create root directory if it doesn't exist
+    _ensure_root(root_dir)
+
+    # Iterate the ordered map so tool order is stable for set-valued configs
+    return tuple(
+        tool_class(root_dir=root_dir)
+        for operation, tool_class in _file_tool_classes().items()
+        if operation in allowed_operations
+    )
 
 
 def get_filesystem_tools(
@@ -371,56 +663,38 @@ def get_filesystem_tools(
 
     Note:
         The function's behavior is controlled by FILESYSTEM_CONFIG['security']['enable_security'],
-        not by the environment setting.
+        not by the environment setting. Tools are cached per (root_dir,
+        allowed_operations), so repeated calls return the same tool
+        instances in a new list.
     """
     try:
         # Check if security is disabled
-        security_enabled = FILESYSTEM_CONFIG.get('security', {}).get('enable_security', False)
-
-        if not security_enabled:
-            # When security is disabled, create tools with no root_dir restriction
-            tools = [
-                ReadFileTool(),  # No root_dir restriction
-                WriteFileTool(),  # No root_dir restriction
-                ListDirectoryTool(),
-                FileSearchTool()
-            ]
-            logger.info(f"Initialized {len(tools)} filesystem tools with no restrictions")
-            return tools
+        if not _SECURITY_ENABLED:
+            return list(_unrestricted_tools())
 
         # For secured mode, use the configured root_dir
-        root_dir = root_dir or FILESYSTEM_CONFIG.get('root_dir') or os.getcwd()
-        allowed_operations = allowed_operations or FILESYSTEM_CONFIG.get('allowed_operations')
+        root_dir = root_dir or _DEFAULT_ROOT or os.getcwd()
+        allowed = frozenset(allowed_operations) if allowed_operations else _DEFAULT_OPS
 
-        # Create root directory if it doesn't exist
-        if not os.path.exists(root_dir):
-            os.makedirs(root_dir, exist_ok=True)
-
-        tools = []
-        operations_map = {
-            'read': ReadFileTool,
-            'write': WriteFileTool,
-            'list': ListDirectoryTool,
-            'search': FileSearchTool
-        }
-
-        for operation in allowed_operations:
-            if operation in operations_map:
-                tool = operations_map[operation](root_dir=root_dir)
-                tools.append(tool)
-
-        return tools
+        return list(_restricted_tools(root_dir, allowed))
 
     except Exception as e:
-        logger.error(f"Error initializing filesystem tools: {str(e)}")
+        logger.error("Error initializing filesystem tools: %s", e)
         raise
 
 
+def _reload_config() -> None:
+    """
+    Re-read FILESYSTEM_CONFIG into the module constants.
 
-
-
-
-
+    Also drops tools and safe subclasses built from the previous values.
+    Meant for tests that patch the configuration.
+    """
+    global _MAX_FILE_SIZE, _SECURITY_ENABLED, _DEFAULT_ROOT, _DEFAULT_OPS
+    _MAX_FILE_SIZE, _SECURITY_ENABLED, _DEFAULT_ROOT, _DEFAULT_OPS = _snapshot_config()
+    _SAFE_SUBCLASSES.clear()
+    _unrestricted_tools.cache_clear()
+    _restricted_tools.cache_clear()
 
 
 # def get_filesystem_tools(
@@ -507,10 +781,6 @@ def create_secure_tool(tool_class, root_dir: str, **kwargs) -> Tool:
     return tool_class(root_dir=root_dir, **kwargs)
 
 
-
-
-
-
 """
 Security Best Practices:
 =====================
@@ -557,7 +827,7 @@ def secure_file_operation(func):
             return func(*args, **kwargs)
 
         except Exception as e:
-            logger.error(f"Security error: {str(e)}")
+            logger.error("Security error: %s", e)
             raise
 
     return wrapper
@@ -600,6 +870,10 @@ class ResourceError(FileSystemError):
     pass
 
 
+# Errors kept by FileSystemMetrics unless configured otherwise
+ERROR_BUFFER_SIZE = 1024
+
+
 # Optional: Monitoring and Metrics
 class FileSystemMetrics:
     """
@@ -611,36 +885,59 @@ class FileSystemMetrics:
 
     Attributes:
         operations (dict): Counter for different types of operations
-        errors (list): List of recorded errors with timestamps
+        errors (deque): Most recent errors as (time_ns, error type, message)
         total_bytes_processed (int): Total bytes processed by all operations
 
+    The standard operations (read/write/list/search) are counted in slots;
+    any other operation name goes to an overflow dict.
+
     Example:
         >>> metrics = FileSystemMetrics()
         >>> metrics.record_operation('read', 1024)  # Record 1KB read
         >>> print(metrics.get_metrics())  # Get current metrics
     """
 
-    def __init__(self):
-        self.operations = {
-            'read': 0,
-            'write': 0,
-            'list': 0,
-            'search': 0
-        }
-        self.errors = []
+    __slots__ = ('read', 'write', 'list', 'search', '_other',
+                 'errors', 'total_bytes_processed')
+
+    def __init__(self, max_errors: int = ERROR_BUFFER_SIZE):
+        self.read = 0
+        self.write = 0
+        self.list = 0
+        self.search = 0
+        self._other = {}
+        self.errors = deque(maxlen=max_errors)
         self.total_bytes_processed = 0
 
+    @property
+    def operations(self) -> Dict[str, int]:
+        """Counter for different types of operations."""
+        counts = {
+            'read': self.read,
+            'write': self.write,
+            'list': self.list,
+            'search': self.search
+        }
+        counts.update(self._other)
+        return counts
+
     def record_operation(self, operation: str, bytes_processed: int = 0):
         """Record an operation and its resource usage."""
-        self.operations[operation] = self.operations.get(operation, 0) + 1
+        if operation == 'read':
+            self.read += 1
+        elif operation == 'write':
+            self.write += 1
+        elif operation == 'list':
+            self.list += 1
+        elif operation == 'search':
+            self.search += 1
+        else:
+            self._other[operation] = self._other.get(operation, 0) + 1
         self.total_bytes_processed += bytes_processed
 
     def add_error(self, error: Exception):
-        """Record an error."""
-        self.errors.append({
-            'timestamp': datetime.now(),
-            'error': str(error)
-        })
+        """Record an error; the oldest is dropped once the buffer is full."""
+        self.errors.append((time.time_ns(), type(error).__name__, str(error)))
 
     def get_metrics(self):
         """Get current metrics."""
@@ -651,22 +948,6 @@ class FileSystemMetrics:
         }
 
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
 # """
 # File System Tools Module
 # Provides file system operation tools from LangChain.
@@ -715,4 +996,4 @@ class FileSystemMetrics:
 #
 #     except Exception as e:
 #         logger.error(f"Error initializing filesystem tools: {str(e)}")
-#         raise
\ No newline at end of file
+#         raise
@@ -25,6 +25,9 @@ Basic tool collection:
 Specific tool initialization:
     >>> tools = get_all_tools(llm, enabled_only=['calculator', 'file_reader'])
 
+Deferred tool construction:
+    >>> tools = get_all_tools(llm, lazy=True)  # ToolStub placeholders
+
 Example with custom configuration:
     >>> tools = get_all_tools(
     ...     llm,
@@ -33,20 +36,90 @@ Example with custom configuration:
     ... )
 """
 
-from typing import List
-from langchain.tools import Tool
+from typing import Callable, List, Optional, Tuple
+from langchain.tools import BaseTool, Tool
+from pydantic import Field
+
+# Tool getters are imported inside get_all_tools, under the ENABLED_TOOLS
+# check, so disabled tools never import their dependencies
+from config.settings import PROXY_CONFIG, ENABLED_TOOLS, FILESYSTEM_CONFIG
+from ._identity_cache import IdentityCache
+
+
+class ToolStub(BaseTool):
+    """
+    Lightweight placeholder for a tool that is built on first use.
+
+    Carries only the name and description the agent needs to select the tool.
+    The real tool is created by ``loader`` the first time the stub runs and is
+    reused for every later call.
+
+    Attributes:
+        loader (Callable[[], BaseTool]): Factory for the real tool
+        tool (Optional[BaseTool]): Real tool, once resolved
+    """
+    name: str
+    description: str
+    loader: Optional[Callable[[], BaseTool]] = Field(default=None, exclude=True)
+    tool: Optional[BaseTool] = Field(default=None, exclude=True)
+
+    class Config:
+        """Pydantic config"""
+        arbitrary_types_allowed = True
+
+    def resolve(self) -> BaseTool:
+        """
+        Build the real tool on first call and return it.
+
+        Returns:
+            BaseTool: The resolved tool
+        """
+        if self.tool is None:
+            self.tool = self.loader()
+            logger.info("Loaded tool on first use: %s", self.name)
+        return self.tool
+
+    def _run(self, tool_input: str) -> str:
+        """Delegate execution to the real tool."""
+        return self.resolve().run(tool_input)
+
+
+def _stub_or_build(
+        lazy: bool,
+        loader: Callable[[], BaseTool],
+        name: str,
+        description: str,
+        return_direct: bool = False
+) -> BaseTool:
+    """
+    Return a ToolStub for the loader when lazy, otherwise build the tool now.
+
+    Args:
+        lazy (bool): Whether to defer tool construction
+        loader (Callable[[], BaseTool]): Factory for the real tool
+        name (str): Tool name exposed to the agent
+        description (str): Tool description exposed to the agent
+        return_direct (bool): Mirrors the real tool's return_direct flag
+
+    Returns:
+        BaseTool: Stub or real tool
+    """
+    if not lazy:
+        return loader()
+    return ToolStub(
+        name=name,
+        description=description,
+        return_direct=return_direct,
+        loader=loader
+    )
+
 
-# Import tool getters - add new tool imports here
-from .calculator_tool import get_calculator_tool
-from .file_reader_tool import get_file_reader_tool
-from .wikipedia_tool import get_wikipedia_tool
-from .llm_math_tool import get_llm_math_tool
-from .file_writer_tool import get_file_writer_tool
-from .filesystem_tools import get_filesystem_tools
-from config.settings import AWS_CONFIG, ENABLED_TOOLS, FILESYSTEM_CONFIG
+# Tool lists per (LLM, lazy, ENABLED_TOOLS items), for recently used LLMs
+ALL_TOOLS_CACHE_SIZE = 16
+_ALL_TOOLS_CACHE = IdentityCache(ALL_TOOLS_CACHE_SIZE)
 
 
-def get_all_tools(llm) -> List[Tool]:
+def get_all_tools(llm, lazy: bool = False) -> List[Tool]:
     """
     Aggregate and initialize all available tools based on configuration.
 
@@ -55,13 +128,12 @@ def get_all_tools(llm) -> List[Tool]:
 
     Args:
         llm: Language model instance required by certain tools
+        lazy (bool): Return ToolStub placeholders that build the real tool
+            on first use instead of constructing every tool up front
 
     Returns:
         List[Tool]: List of initialized and configured tools
 
-    Raises:
-        Exception: If critical tool initialization fails
-
     Example:
         >>> llm = ChatBedrock(model="anthropic.claude-v3")
         >>> tools = get_all_tools(llm)
@@ -71,44 +143,117 @@ def get_all_tools(llm) -> List[Tool]:
         - Tools are initialized based on ENABLED_TOOLS configuration
         - Each tool may have specific initialization requirements
         - Failed tool initialization is logged but doesn't stop other tools
+        - Filesystem tools are always built eagerly since they expose
+          their own argument schemas
+        - Results are cached per LLM, lazy flag and ENABLED_TOOLS state;
+          each call returns a new list of the shared tool instances.
+          Lists with failed tools are not cached
     """
-    tools = []
-
-    try:
-        # Add calculator tool if enabled
-        if ENABLED_TOOLS.get('calculator', True):
-            tools.append(get_calculator_tool(llm))
-
-        # Add file reader tool if enabled
-        if ENABLED_TOOLS.get('file_reader', True):
-            tools.append(get_file_reader_tool())
-
-        # Add file writer tool if enabled
-        if ENABLED_TOOLS.get('file_writer', True):
-            tools.append(get_file_writer_tool())
-
-        # Add Wikipedia tool if enabled, with proxy configuration
-        if ENABLED_TOOLS.get('wikipedia', False):
-            # Get proxy settings from AWS_CONFIG
-            proxy = AWS_CONFIG.proxies if hasattr(AWS_CONFIG, 'proxies') else None
-            tools.append(get_wikipedia_tool(proxy=proxy))
+    extra = (lazy, tuple(ENABLED_TOOLS.items()))
+    tools = _ALL_TOOLS_CACHE.get((llm,), extra)
+    if tools is None:
+        tools, complete = _build_all_tools(llm, lazy)
+        if not complete:
+            # Don't pin a partial list; retry the failed tools next call
+            return tools
+        _ALL_TOOLS_CACHE.put((llm,), tools, extra)
+    return list(tools)
+
+
+def _calculator(llm, lazy: bool) -> List[BaseTool]:
+    """Calculator tool."""
+    from .calculator_tool import get_calculator_tool, CALCULATOR_DESCRIPTION
+    return [_stub_or_build(
+        lazy, lambda: get_calculator_tool(llm),
+        "Calculator", CALCULATOR_DESCRIPTION, return_direct=True
+    )]
+
+
+def _file_reader(llm, lazy: bool) -> List[BaseTool]:
+    """File reader tool."""
+    from .file_reader_tool import get_file_reader_tool, get_file_reader_description
+    return [_stub_or_build(
+        lazy, get_file_reader_tool,
+        "FileReader", get_file_reader_description()
+    )]
+
+
+def _file_writer(llm, lazy: bool) -> List[BaseTool]:
+    """File writer tool."""
+    from .file_writer_tool import get_file_writer_tool, FILE_WRITER_DESCRIPTION
+    return [_stub_or_build(
+        lazy, get_file_writer_tool,
+        "FileWriter", FILE_WRITER_DESCRIPTION
+    )]
+
+
+def _wikipedia(llm, lazy: bool) -> List[BaseTool]:
+    """Wikipedia tool, with proxy configuration."""
+    from .wikipedia_tool import get_wikipedia_tool, get_wikipedia_description
+    # Same proxies the AWS clients use, without importing botocore
+    proxy = dict(PROXY_CONFIG)
+    return [_stub_or_build(
+        lazy, lambda: get_wikipedia_tool(proxy=proxy),
+        "Wikipedia", get_wikipedia_description()
+    )]
+
+
+def _llm_math(llm, lazy: bool) -> List[BaseTool]:
+    """LLM math tool."""
+    from .llm_math_tool import get_llm_math_tool, LLM_MATH_NAME, LLM_MATH_DESCRIPTION
+    return [_stub_or_build(
+        lazy, lambda: get_llm_math_tool(llm),
+        LLM_MATH_NAME, LLM_MATH_DESCRIPTION
+    )]
+
+
+def _filesystem(llm, lazy: bool) -> List[BaseTool]:
+    """Filesystem tools; always built eagerly."""
+    from .filesystem_tools import get_filesystem_tools
+    return get_filesystem_tools(root_dir=FILESYSTEM_CONFIG.get('root_dir'))
+
+
+# (ENABLED_TOOLS key, enabled by default, factory) in tool order. Each
+# factory imports its tool module and returns a list of tools.
+_TOOL_REGISTRY = (
+    ('calculator', True, _calculator),
+    ('file_reader', True, _file_reader),
+    ('file_writer', True, _file_writer),
+    ('wikipedia', False, _wikipedia),
+    ('llm_math', True, _llm_math),
+    ('filesystem', True, _filesystem),
+)
+
+
+def _build_all_tools(llm, lazy: bool) -> Tuple[List[Tool], bool]:
+    """
+    Build the enabled tools for get_all_tools.
 
-        # Add LLM math tool if enabled
-        if ENABLED_TOOLS.get('llm_math', True):
-            tools.append(get_llm_math_tool(llm))
+    Args:
+        llm: Language model instance required by certain tools
+        lazy (bool): Return ToolStub placeholders for deferred construction
 
-        # Add filesystem tools if enabled
-        if ENABLED_TOOLS.get('filesystem', True):
-            filesystem_tools = get_filesystem_tools(
-                root_dir=FILESYSTEM_CONFIG.get('root_dir')
-            )
-            tools.extend(filesystem_tools)
+    Returns:
+        Tuple[List[Tool], bool]: Newly built tools, and whether every
+            enabled tool initialized successfully
+    """
+    tools = []
+    complete = True
+    enabled = ENABLED_TOOLS
 
-        return tools
+    for name, default, factory in _TOOL_REGISTRY:
+        if not enabled.get(name, default):
+            continue
+        try:
+            tools.extend(factory(llm, lazy))
+        except Exception as e:
+            logger.error("Error initializing tool %s: %s", name, e)
+            track_tool_initialization(name, False)
+            complete = False
+        else:
+            track_tool_initialization(name, True)
 
-    except Exception as e:
-        logger.error(f"Error initializing tools: {str(e)}")
-        raise
+    return tools, complete
 
 
 """
@@ -119,8 +264,7 @@ Tool Extension Guide:
 -------------------
 a. Create tool implementation file (new_tool.py)
 b. Create getter function
-c. Add import statement here
-d. Add to get_all_tools function
+c. Add a factory to _TOOL_REGISTRY, importing the getter inside it
 
 Example:
     # 1. Create new_tool.py
@@ -137,12 +281,15 @@ Example:
             description="Tool description"
         )
 
-    # 2. Add import
-    from .new_tool import get_new_tool
+    # 2. Add a factory and register it in _TOOL_REGISTRY
+    def _new_tool(llm, lazy: bool) -> List[BaseTool]:
+        from .new_tool import get_new_tool
+        return [get_new_tool(llm)]
 
-    # 3. Add to get_all_tools
-    if ENABLED_TOOLS.get('new_tool', True):
-        tools.append(get_new_tool(llm))
+    _TOOL_REGISTRY = (
+        ...,
+        ('new_tool', True, _new_tool),
+    )
 
 2. Tool Configuration:
 -------------------
@@ -158,7 +305,7 @@ def initialize_tool(tool_getter, *args, **kwargs):
     try:
         return tool_getter(*args, **kwargs)
     except Exception as e:
-        logger.error(f"Failed to initialize {tool_getter.__name__}: {e}")
+        logger.error("Failed to initialize %s: %s", tool_getter.__name__, e)
         return None
 
 4. Tool Validation:
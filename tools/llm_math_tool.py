@@ -13,12 +13,161 @@ Usage:
     result = math_tool.run("2 + 2 * 3")
 """
 
-from langchain_community.agent_toolkits.load_tools import load_tools
+from ._identity_cache import IdentityCache
+import ast
 import logging
+import math
+import operator
+import re
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Name and description of the tool produced by load_tools(["llm-math"])
+LLM_MATH_NAME = "Calculator"
+LLM_MATH_DESCRIPTION = "Useful for when you need to answer questions about math."
+
+# Inputs that may be plain arithmetic; anything else goes straight to the LLM
+_ARITHMETIC_RE = re.compile(r"[\d\s.+\-*/()^a-z_,%]+")
+
+# Operators, functions and constants evaluated locally
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: pow
+}
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg
+}
+_FUNCTIONS = {
+    'sqrt': math.sqrt,
+    'pow': math.pow,
+    'abs': abs,
+    'log': math.log,
+    'exp': math.exp
+}
+_CONSTANTS = {
+    'pi': math.pi,
+    'e': math.e
+}
+
+# Powers whose result would need more bits are left to the LLM
+MAX_POWER_BITS = 4096
+
+# Longer inputs are left to the LLM; keeps parsing and evaluation shallow
+MAX_EXPRESSION_LENGTH = 500
+
+# Errors meaning "not evaluable locally"; the LLM chain gets the input instead
+_FALLBACK_ERRORS = (ValueError, ArithmeticError, SyntaxError, TypeError, RecursionError)
+
+# Math tools for the most recently used LLMs
+MATH_TOOL_CACHE_SIZE = 8
+_MATH_TOOL_CACHE = IdentityCache(MATH_TOOL_CACHE_SIZE)
+
+
+def _eval_node(node: ast.AST) -> float:
+    """
+    Evaluate a whitelisted arithmetic AST node.
+
+    Args:
+        node (ast.AST): Node from ast.parse(..., mode="eval")
+
+    Returns:
+        float: Value of the node
+
+    Raises:
+        ValueError: If the node is not plain arithmetic or has no real value
+    """
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        left = _eval_node(node.left)
+        right = _eval_node(node.right)
+        if (isinstance(node.op, ast.Pow) and abs(left) > 1
+                and abs(right) * math.log2(abs(left)) > MAX_POWER_BITS):
+            raise ValueError("Power too large")
+        result = _BINARY_OPS[type(node.op)](left, right)
+        if isinstance(result, complex):
+            # e.g. (-8)**0.5; the LLM chain reports these properly
+            raise ValueError("Result is not a real number")
+        return result
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_eval_node(node.operand))
+    if isinstance(node, ast.Name) and node.id in _CONSTANTS:
+        return _CONSTANTS[node.id]
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+            and node.func.id in _FUNCTIONS and not node.keywords):
+        return _FUNCTIONS[node.func.id](*(_eval_node(arg) for arg in node.args))
+    raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+
+
+def _safe_eval(expression: str) -> str:
+    """
+    Evaluate a plain arithmetic expression without the LLM.
+
+    Args:
+        expression (str): Expression such as "2 + 2 * 3" or "sqrt(16) + 2"
+
+    Returns:
+        str: Result in the LLM Math chain's "Answer: ..." format
+
+    Raises:
+        ValueError: If the input is not plain arithmetic, too long, or has
+            no real value
+        ArithmeticError: If evaluation fails (division by zero, overflow)
+    """
+    expression = expression.strip()
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise ValueError("Expression too long")
+    if not _ARITHMETIC_RE.fullmatch(expression):
+        raise ValueError("Not an arithmetic expression")
+
+    # '^' means power in math questions, not bitwise xor
+    tree = ast.parse(expression.replace('^', '**'), mode='eval')
+    result = _eval_node(tree.body)
+    if isinstance(result, float) and result.is_integer():
+        result = int(result)
+    return f"Answer: {result}"
+
+
+def _with_local_arithmetic(tool):
+    """
+    Make a math tool answer plain arithmetic locally.
+
+    Inputs that _safe_eval cannot handle, such as word problems, still go
+    to the original LLM-backed function or coroutine.
+
+    Args:
+        tool: Tool returned by load_tools(["llm-math"])
+
+    Returns:
+        Tool: The same tool, with func and coroutine wrapped
+    """
+    llm_func = tool.func
+    llm_coroutine = tool.coroutine
+
+    def calculate(expression: str) -> str:
+        try:
+            return _safe_eval(expression)
+        except _FALLBACK_ERRORS:
+            return llm_func(expression)
+
+    async def acalculate(expression: str) -> str:
+        try:
+            return _safe_eval(expression)
+        except _FALLBACK_ERRORS:
+            return await llm_coroutine(expression)
+
+    tool.func = calculate
+    if llm_coroutine is not None:
+        tool.coroutine = acalculate
+    return tool
+
 
 def get_llm_math_tool(llm):
     """
@@ -39,18 +188,29 @@ def get_llm_math_tool(llm):
         - This tool requires an LLM instance to work
         - Can handle complex mathematical expressions
         - Returns the first tool from load_tools as it only loads one math tool
+        - The tool is built once per LLM and reused by later calls
+        - Plain arithmetic is evaluated locally; only other input reaches the LLM
     """
+    tool = _MATH_TOOL_CACHE.get((llm,))
+    if tool is not None:
+        return tool
+
     try:
+        # Imported here: load_tools pulls in most of langchain_community
+        from langchain_community.agent_toolkits.load_tools import load_tools
+
         # Load the LLM Math tool from LangChain
         math_tools = load_tools(["llm-math"], llm=llm)
         if not math_tools:
             raise ValueError("No math tools loaded")
         else:
             logger.info("Successfully loaded LLM Math tool")
-        return math_tools[0]  # Return the first (and only) math tool
+        # Return the first (and only) math tool
+        tool = _with_local_arithmetic(math_tools[0])
+        return _MATH_TOOL_CACHE.put((llm,), tool)
 
     except Exception as e:
-        logger.error(f"Error loading LLM Math tool: {str(e)}")
+        logger.error("Error loading LLM Math tool: %s", e)
         raise
 
 
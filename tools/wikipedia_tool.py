@@ -20,7 +20,7 @@ Provides functionality for searching and retrieving information from Wikipedia.
 
 Features:
 - Wikipedia article search
-- Content retrieval
+- Content retrieval over a pooled HTTP session
 - Error handling
 - Configurable search parameters
 
@@ -31,14 +31,630 @@ Usage:
 """
 
 from langchain.tools import Tool
-from langchain_community.utilities import WikipediaAPIWrapper
+from pydantic import Field
+from collections import OrderedDict
+from concurrent.futures import Future
+from operator import itemgetter
+import asyncio
 import logging
+import re
+import threading
+import time
 import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+from ._http import (
+    DEFAULT_TIMEOUT,
+    CircuitBreaker,
+    CircuitOpenError,
+    get_executor,
+    get_session,
+    on_executor_thread
+)
+
+# orjson is optional; fall back to requests' json decoding without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# MediaWiki Action API endpoint for a language edition
+API_URL = "https://{lang}.wikipedia.org/w/api.php"
+
+# Longest query sent to the search API, as in WikipediaAPIWrapper
+MAX_QUERY_LENGTH = 300
+
+# Returned when a search matches no page
+NO_RESULT = "No good Wikipedia Search Result was found"
+
+# Returned, uncached, while the circuit breaker is open
+UNAVAILABLE = "Wikipedia is temporarily unavailable; try again later"
+
+# Consecutive connection failures, timeouts or 5xx responses that stop
+# requests to Wikipedia, and the seconds before one is tried again
+BREAKER_FAIL_MAX = 5
+BREAKER_RESET_TIMEOUT = 30.0
+_breaker = CircuitBreaker(BREAKER_FAIL_MAX, BREAKER_RESET_TIMEOUT)
+
+# Query results are reused for this long, in seconds
+RESULT_CACHE_TTL = 3600.0
+RESULT_CACHE_SIZE = 1024
+
+# (lang, normalized query, top_k_results, max_doc_length) -> (expiry, text)
+_result_cache: "OrderedDict[Tuple, Tuple[float, str]]" = OrderedDict()
+_result_lock = threading.Lock()
+
+# Last validated response per request, for If-None-Match revalidation once
+# a result has expired: (api_url, params) -> (etag, decoded response)
+VALIDATOR_CACHE_SIZE = 4096
+_validators: "OrderedDict[Tuple, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+
+# API endpoints already sent a warm-up request; guarded by _result_lock
+_warmed = set()
+
+# Largest exchars TextExtracts accepts; longer documents are cut locally
+MAX_EXTRACT_CHARS = 1200
+
+# Intro extracts the API returns per request, and so titles per batch
+BATCH_SIZE = 20
+
+# Queries and prefetches in flight, by result cache key; guarded by _result_lock
+_pending: Dict[Tuple, Future] = {}
+
+# Longest time run() waits on a matching in-flight query before querying itself
+INFLIGHT_WAIT = 10.0
+
+# Quoted phrases, or runs of capitalized words, in an agent's thought
+# (words are joined by spaces only, so a run never crosses a line break)
+_ENTITY_RE = re.compile(r'"([^"\n]{2,100})"|\b([A-Z][\w\'-]*(?:[ \t]+[A-Z][\w\'-]*)*)')
+
+# Runs of spaces/tabs, and line breaks with the blank lines around them
+_SPACES_RE = re.compile(r'[ \t\u00a0]+')
+_LINE_BREAKS_RE = re.compile(r' ?\n\s*')
+
+# Capitalized words that start sentences or ReAct steps, not entities
+_ENTITY_STOPWORDS = frozenset((
+    'I', 'A', 'An', 'The', 'This', 'That', 'It', 'What', 'Who', 'When', 'Where',
+    'Which', 'How', 'Why', 'Now', 'Then', 'So', 'Let', 'First', 'Next',
+    'Thought', 'Action', 'Observation', 'Final', 'Answer', 'Input', 'Wikipedia'
+))
+
+
+def clear_wikipedia_cache() -> None:
+    """Drop every cached Wikipedia result."""
+    with _result_lock:
+        _result_cache.clear()
+        _validators.clear()
+
+
+def _clean(text: str) -> str:
+    """
+    Normalize whitespace in a plain-text extract.
+
+    Extracts are requested as plain text, so there is no markup to strip;
+    what remains is doubled spaces and blank lines left behind by removed
+    templates, which only cost characters of max_doc_length.
+
+    Args:
+        text (str): Extract text
+
+    Returns:
+        str: Text with single spaces and single line breaks
+    """
+    return _LINE_BREAKS_RE.sub('\n', _SPACES_RE.sub(' ', text)).strip()
+
+
+# Search rank of a page returned by generator=search
+_SEARCH_RANK = itemgetter('index')
+
+
+def _summary(page: Dict[str, Any]) -> str:
+    """Format a page with an extract as a "Page: ...\nSummary: ..." block."""
+    return f"Page: {page['title']}\nSummary: {_clean(page['extract'])}"
+
+
+def extract_candidate_entities(text: str, limit: int = 5) -> List[str]:
+    """
+    Pick likely Wikipedia lookups out of an agent's intermediate thought.
+
+    Quoted phrases and runs of capitalized words are returned in order of
+    appearance, without duplicates. The heuristic is cheap and loose; it is
+    meant for seeding prefetches, where a wrong guess only costs a request.
+
+    Args:
+        text (str): Thought or partial trace text
+        limit (int): Maximum number of candidates returned
+
+    Returns:
+        List[str]: Candidate search queries
+    """
+    candidates: List[str] = []
+    for quoted, capitalized in _ENTITY_RE.findall(text):
+        candidate = quoted.strip() or capitalized
+        if not quoted and _ENTITY_STOPWORDS.issuperset(candidate.split()):
+            continue
+        if candidate and candidate not in candidates:
+            candidates.append(candidate)
+            if len(candidates) >= limit:
+                break
+    return candidates
+
+
+class WikipediaSearch:
+    """
+    Search Wikipedia and summarize the top matching pages.
+
+    Produces the same output as WikipediaAPIWrapper.run, but fetches the
+    search results and their intro extracts in a single API request over
+    the shared session.
+
+    Attributes:
+        lang (str): Wikipedia language
+        top_k_results (int): Number of pages summarized per query
+        max_doc_length (int): Maximum length of the returned text
+        proxy (Optional[Dict[str, str]]): Proxies for this tool's requests
+    """
+
+    __slots__ = ('lang', 'top_k_results', 'max_doc_length', 'proxy', 'api_url')
+
+    def __init__(self, lang: str = "en", top_k_results: int = 3, max_doc_length: int = 2000,
+                 proxy: Optional[Dict[str, str]] = None):
+        self.lang = lang
+        self.top_k_results = top_k_results
+        self.max_doc_length = max_doc_length
+        self.proxy = dict(proxy) if proxy else None
+        self.api_url = API_URL.format(lang=lang)
+
+    def _query(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send an Action API query and return the decoded response.
+
+        With orjson installed the raw body bytes are parsed directly,
+        without first decoding them to a str. Responses that carry an
+        ETag are remembered, and the same query is later sent with
+        If-None-Match so an unchanged response costs no body transfer.
+
+        Requests time out after DEFAULT_TIMEOUT. While the circuit breaker
+        is open, no request is sent: a remembered response is returned if
+        there is one, and CircuitOpenError is raised otherwise.
+
+        Args:
+            params (Dict[str, Any]): Query parameters, without action/format
+
+        Returns:
+            Dict[str, Any]: Decoded JSON response
+
+        Raises:
+            CircuitOpenError: If the breaker is open and nothing is remembered
+            requests.RequestException: If the request fails
+        """
+        params = {'action': 'query', 'format': 'json', **params}
+        key = (self.api_url, tuple(params.items()))
+        with _result_lock:
+            validated = _validators.get(key)
+
+        if not _breaker.allow():
+            if validated:
+                return validated[1]
+            raise CircuitOpenError("Wikipedia requests suspended after repeated failures")
+
+        try:
+            response = get_session().get(
+                self.api_url,
+                params=params,
+                headers={'If-None-Match': validated[0]} if validated else None,
+                proxies=self.proxy,
+                timeout=DEFAULT_TIMEOUT
+            )
+        except (requests.ConnectionError, requests.Timeout):
+            _breaker.record_failure()
+            raise
+        if response.status_code >= 500:
+            _breaker.record_failure()
+        else:
+            _breaker.record_success()
+
+        if response.status_code == 304 and validated:
+            with _result_lock:
+                if key in _validators:
+                    _validators.move_to_end(key)
+            return validated[1]
+
+        response.raise_for_status()
+        if orjson is not None:
+            data = orjson.loads(response.content)
+        else:
+            data = response.json()
+
+        etag = response.headers.get('ETag')
+        if etag:
+            with _result_lock:
+                _validators[key] = (etag, data)
+                _validators.move_to_end(key)
+                if len(_validators) > VALIDATOR_CACHE_SIZE:
+                    _validators.popitem(last=False)
+        return data
+
+    def run(self, query: str) -> str:
+        """
+        Search Wikipedia and return page summaries.
+
+        Results are cached for RESULT_CACHE_TTL seconds per language,
+        settings and case-insensitive query, so repeated lookups from an
+        agent loop skip the network. Concurrent calls for the same query
+        (and prefetches) share one request: the first caller fetches and
+        the others wait for its result. Calls running on the shared
+        executor (arun, abatch_run) never wait on other pool work; they
+        fetch on their own instead.
+
+        Args:
+            query (str): Search query
+
+        Returns:
+            str: "Page: ...\nSummary: ..." blocks, truncated to max_doc_length
+        """
+        key = self._cache_key(query)
+        with _result_lock:
+            result = self._cached(key)
+            if result is not None:
+                return result
+            future = _pending.get(key)
+            if future is None:
+                future = _pending[key] = Future()
+                owner = True
+            else:
+                owner = False
+
+        if not owner and on_executor_thread():
+            # The in-flight fetch may be queued behind this very worker
+            return self._fetch_and_store(key, query)
+        if not owner:
+            try:
+                return future.result(timeout=INFLIGHT_WAIT)
+            except Exception as e:
+                logger.debug("In-flight query for %r unusable, querying again: %s", query, e)
+                return self._fetch_and_store(key, query)
+
+        try:
+            result = self._fetch_and_store(key, query)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._forget_pending(key, future)
+
+    def prefetch(self, query: str) -> None:
+        """
+        Start fetching a query in the background.
+
+        A later run() for the same query picks up the result, so the
+        request overlaps with whatever the caller does meanwhile, such as
+        the LLM generating its next step.
+
+        Args:
+            query (str): Search query expected soon
+        """
+        key = self._cache_key(query)
+        with _result_lock:
+            if key in _pending or self._cached(key) is not None:
+                return
+            future = get_executor().submit(self._fetch_and_store, key, query)
+            _pending[key] = future
+
+        # Registered outside the lock: an already finished future runs it here
+        future.add_done_callback(lambda done: self._forget_pending(key, done))
+
+    def _cache_key(self, query: str) -> Tuple:
+        """Result cache key for a query with this client's settings."""
+        return self.lang, query.strip().lower(), self.top_k_results, self.max_doc_length
+
+    @staticmethod
+    def _cached(key: Tuple) -> Optional[str]:
+        """
+        Return a fresh cached result; caller holds _result_lock.
+
+        Args:
+            key (Tuple): Result cache key
+
+        Returns:
+            Optional[str]: Cached text, or None if missing or expired
+        """
+        entry = _result_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _result_cache[key]
+            return None
+        _result_cache.move_to_end(key)
+        return entry[1]
+
+    @staticmethod
+    def _forget_pending(key: Tuple, future: Future) -> None:
+        """Drop a finished prefetch from the pending map."""
+        with _result_lock:
+            if _pending.get(key) is future:
+                del _pending[key]
+
+    def _fetch_and_store(self, key: Tuple, query: str) -> str:
+        """
+        Query the API and cache the result.
+
+        Args:
+            key (Tuple): Result cache key
+            query (str): Search query
+
+        Returns:
+            str: Formatted page summaries, or UNAVAILABLE (not cached)
+        """
+        now = time.monotonic()
+        try:
+            result = self._fetch(query)
+        except CircuitOpenError:
+            return UNAVAILABLE
+
+        with _result_lock:
+            _result_cache[key] = (now + RESULT_CACHE_TTL, result)
+            _result_cache.move_to_end(key)
+            if len(_result_cache) > RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+        return result
+
+    def _extract_params(self, limit: int) -> Dict[str, Any]:
+        """
+        Query parameters for plain-text intro extracts of up to limit pages.
+
+        No page contributes more than max_doc_length characters to a
+        result, so when the API allows it the extracts are truncated
+        server-side instead of being downloaded in full.
+
+        Args:
+            limit (int): Number of pages to return extracts for
+
+        Returns:
+            Dict[str, Any]: TextExtracts parameters
+        """
+        params = {'prop': 'extracts', 'exintro': 1, 'explaintext': 1, 'exlimit': limit}
+        if self.max_doc_length <= MAX_EXTRACT_CHARS:
+            params['exchars'] = self.max_doc_length
+        return params
+
+    def _fetch(self, query: str) -> str:
+        """
+        Run a search against the API, bypassing the result cache.
+
+        Args:
+            query (str): Search query
+
+        Returns:
+            str: Formatted page summaries
+        """
+        data = self._query({
+            'generator': 'search',
+            'gsrsearch': query[:MAX_QUERY_LENGTH],
+            'gsrlimit': self.top_k_results,
+            **self._extract_params(self.top_k_results)
+        })
+        query_data = data.get('query')
+        if not query_data or not query_data.get('pages'):
+            return NO_RESULT
+        pages = query_data['pages']
+
+        if len(pages) == 1:
+            # Common for top_k_results=1 and narrow queries: nothing to rank
+            page, = pages.values()
+            return _summary(page)[:self.max_doc_length] if page.get('extract') else NO_RESULT
+
+        # Pages arrive keyed by id; 'index' is the search rank
+        summaries = [
+            _summary(page)
+            for page in sorted(pages.values(), key=_SEARCH_RANK)
+            if page.get('extract')
+        ]
+        if not summaries:
+            return NO_RESULT
+        return "\n\n".join(summaries)[:self.max_doc_length]
+
+    def batch_run(self, queries: List[str]) -> List[str]:
+        """
+        Look up several page titles with one API request per BATCH_SIZE.
+
+        Queries are matched as titles (following redirects), so several
+        entities from one reasoning step cost a single round trip. Queries
+        that name no page fall back to a regular search.
+
+        Args:
+            queries (List[str]): Page titles or search queries
+
+        Returns:
+            List[str]: One result per query, in the same order
+        """
+        found: Dict[str, str] = {}
+        titles = list(dict.fromkeys(query.strip() for query in queries if query.strip()))
+        try:
+            for start in range(0, len(titles), BATCH_SIZE):
+                found.update(self._fetch_titles(titles[start:start + BATCH_SIZE]))
+        except CircuitOpenError:
+            # run() below answers each query from the cache or UNAVAILABLE
+            pass
+
+        return [
+            found.get(query.strip()) or self.run(query)
+            for query in queries
+        ]
+
+    def _fetch_titles(self, titles: List[str]) -> Dict[str, str]:
+        """
+        Fetch the intro extracts of up to BATCH_SIZE titles at once.
+
+        Args:
+            titles (List[str]): Page titles
+
+        Returns:
+            Dict[str, str]: Formatted summary for each title that has a page
+        """
+        data = self._query({
+            'titles': '|'.join(titles),
+            'redirects': 1,
+            **self._extract_params(len(titles))
+        }).get('query', {})
+
+        summaries = {
+            page['title']: _summary(page)[:self.max_doc_length]
+            for page in data.get('pages', {}).values()
+            if page.get('extract')
+        }
+
+        # Follow each title through normalization and redirects to its page
+        renamed = {
+            item['from']: item['to']
+            for item in data.get('normalized', []) + data.get('redirects', [])
+        }
+        results = {}
+        for title in titles:
+            target = title
+            for _ in range(3):
+                if target in summaries or target not in renamed:
+                    break
+                target = renamed[target]
+            if target in summaries:
+                results[title] = summaries[target]
+        return results
+
+    async def abatch_run(self, queries: List[str]) -> List[str]:
+        """
+        Async variant of batch_run.
+
+        Args:
+            queries (List[str]): Page titles or search queries
+
+        Returns:
+            List[str]: Same as batch_run
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_executor(), self.batch_run, queries)
+
+    def warm_up(self) -> None:
+        """
+        Open a connection to the API in the background.
+
+        Sends one HEAD request on the shared executor, so DNS, TCP and TLS
+        setup happen before the first real query instead of during it.
+        Each endpoint is warmed once per process; failures are ignored.
+        """
+        with _result_lock:
+            if self.api_url in _warmed:
+                return
+            _warmed.add(self.api_url)
+        get_executor().submit(self._head)
+
+    def _head(self) -> None:
+        """Send a HEAD request to the API endpoint, ignoring failures."""
+        try:
+            get_session().head(self.api_url, proxies=self.proxy, timeout=DEFAULT_TIMEOUT)
+        except requests.RequestException as e:
+            logger.debug("Wikipedia warm-up failed for %s: %s", self.api_url, e)
+
+    async def arun(self, query: str) -> str:
+        """
+        Async variant of run that does not block the event loop.
+
+        Concurrent calls overlap their network round trips on the shared
+        executor and connection pool.
+
+        Args:
+            query (str): Search query
+
+        Returns:
+            str: Same as run
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_executor(), self.run, query)
+
+
+class WikipediaTool(Tool):
+    """
+    Wikipedia Tool that can start lookups ahead of time.
+
+    Attributes:
+        client (Optional[WikipediaSearch]): Search client behind func
+    """
+    client: Optional[WikipediaSearch] = Field(default=None, exclude=True)
+
+    class Config:
+        """Pydantic config"""
+        arbitrary_types_allowed = True
+
+    def prefetch(self, query: str) -> None:
+        """
+        Warm the cache for a query the agent is likely to ask next.
+
+        Args:
+            query (str): Search query
+        """
+        self.client.prefetch(query)
+
+    def batch(self, queries: List[str]) -> List[str]:
+        """
+        Answer several lookups with as few requests as possible.
+
+        Args:
+            queries (List[str]): Page titles or search queries
+
+        Returns:
+            List[str]: One result per query, in the same order
+        """
+        return self.client.batch_run(queries)
+
+    async def abatch(self, queries: List[str]) -> List[str]:
+        """
+        Async variant of batch.
+
+        Args:
+            queries (List[str]): Page titles or search queries
+
+        Returns:
+            List[str]: One result per query, in the same order
+        """
+        return await self.client.abatch_run(queries)
+
+    def prefetch_entities(self, text: str) -> List[str]:
+        """
+        Prefetch the candidate entities found in an agent's thought.
+
+        Args:
+            text (str): Thought or partial trace text
+
+        Returns:
+            List[str]: Queries that were prefetched
+        """
+        candidates = extract_candidate_entities(text)
+        for candidate in candidates:
+            self.client.prefetch(candidate)
+        return candidates
+
+
+def get_wikipedia_description(lang: str = "en", top_k_results: int = 3) -> str:
+    """
+    Build the default Wikipedia tool description.
+
+    Args:
+        lang (str): Wikipedia language
+        top_k_results (int): Number of results fetched per query
+
+    Returns:
+        str: Tool description
+    """
+    return (
+        "Useful for searching and retrieving information from Wikipedia. "
+        "Input should be a search query or topic name. "
+        f"Returns up to {top_k_results} results in {lang} language."
+    )
+
 
 def get_wikipedia_tool(
         lang: str = "en",
@@ -54,10 +670,11 @@ def get_wikipedia_tool(
         lang (str): Wikipedia language (default: "en")
         top_k_results (int): Number of results to fetch (default: 3)
         max_doc_length (int): Maximum length of returned content (default: 2000)
+        proxy (Optional[Dict[str, str]]): Proxies for Wikipedia requests
         custom_description (Optional[str]): Custom tool description
 
     Returns:
-        Tool: Configured Wikipedia search tool
+        WikipediaTool: Configured Wikipedia search tool
 
     Example:
         >>> wiki_tool = get_wikipedia_tool(lang="en", top_k_results=5)
@@ -65,34 +682,28 @@ def get_wikipedia_tool(
         >>> print(result)
     """
     try:
-        # Configure proxies for requests
-        if proxy:
-            # Configure requests to use proxy
-            requests.Session().proxies.update(proxy)
-
-        # Initialize Wikipedia API wrapper with configuration
-        wikipedia = WikipediaAPIWrapper(
+        # Requests go through the shared session with this tool's proxies
+        wikipedia = WikipediaSearch(
             lang=lang,
             top_k_results=top_k_results,
-            doc_content_chars_max=max_doc_length
+            max_doc_length=max_doc_length,
+            proxy=proxy
         )
 
-        # Default tool description
-        default_description = (
-            "Useful for searching and retrieving information from Wikipedia. "
-            "Input should be a search query or topic name. "
-            f"Returns up to {top_k_results} results in {lang} language."
-        )
+        # Connect while the agent is still being set up
+        wikipedia.warm_up()
 
         # Create and return the tool
-        return Tool(
+        return WikipediaTool(
             name="Wikipedia",
             func=wikipedia.run,
-            description=custom_description or default_description
+            coroutine=wikipedia.arun,
+            description=custom_description or get_wikipedia_description(lang, top_k_results),
+            client=wikipedia
         )
 
     except Exception as e:
-        logger.error(f"Error initializing Wikipedia tool: {str(e)}")
+        logger.error("Error initializing Wikipedia tool: %s", e)
         raise
 
 